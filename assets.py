@@ -0,0 +1,89 @@
+# <----------Asset Pipeline---------->
+
+# Loads the dashboard's static assets (assets/*.css, assets/*.js) and
+# minifies them before they are inlined into the generated HTML. The
+# minifiers are deliberately small: they drop comments and redundant
+# whitespace and leave everything else untouched.
+
+import functools
+import os
+import re
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch in '_$'
+
+
+# Drop comments and whitespace outside string literals, keeping one space
+# only where two identifiers/keywords would otherwise merge. Regex literals
+# and statements relying on automatic semicolon insertion are not supported.
+def minify_js(source):
+    out = []
+    i, n = 0, len(source)
+    pending_space = False
+    while i < n:
+        ch = source[i]
+        if ch in '"\'`':
+            j = i + 1
+            while j < n and source[j] != ch:
+                j += 2 if source[j] == '\\' else 1
+            token = source[i:j + 1]
+            i = j + 1
+        elif source.startswith('//', i):
+            j = source.find('\n', i)
+            i = n if j < 0 else j
+            continue
+        elif source.startswith('/*', i):
+            j = source.find('*/', i + 2)
+            i = n if j < 0 else j + 2
+            continue
+        elif ch.isspace():
+            pending_space = True
+            i += 1
+            continue
+        else:
+            token = ch
+            i += 1
+        if pending_space and out and _is_word(out[-1][-1]) and _is_word(token[0]):
+            out.append(' ')
+        pending_space = False
+        out.append(token)
+    return ''.join(out)
+
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{}:;,>])\s*', r'\1', source)
+    return source.replace(';}', '}').strip()
+
+
+# Collapse the whitespace between tags of an HTML shell; only meant for the
+# page template, not for the embedded plot markup
+def minify_html(source):
+    source = re.sub(r'>\s+<', '><', source)
+    return re.sub(r'\n\s*', '\n', source).strip()
+
+
+MINIFIERS = {
+    '.js': minify_js,
+    '.css': minify_css,
+    '.html': minify_html,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load_asset(name, minify=True):
+    with open(os.path.join(ASSETS_DIR, name), encoding='utf-8') as f:
+        source = f.read()
+    if minify:
+        source = MINIFIERS[os.path.splitext(name)[1]](source)
+    return source
+
+
+if __name__ == '__main__':
+    for name in sorted(os.listdir(ASSETS_DIR)):
+        print(f"{name}: {len(load_asset(name, minify=False))} -> {len(load_asset(name))} bytes")
@@ -0,0 +1,64 @@
+// Dashboard runtime, included once per page.
+// Reads the data-start / data-end hours of every plot container in one pass
+// and shows each plot only inside its time window. The windows are checked
+// again every minute, so plots appear and disappear without a reload.
+//
+// Keep statements terminated with semicolons and avoid regex literals:
+// assets.py minifies this file with a simple tokenizer.
+(function () {
+    var REFRESH_MS = 60 * 1000;
+
+    function formatHour(hour) {
+        return hour > 12 ? (hour - 12) + ":00 PM" : (hour == 12 ? "12:00 PM" : hour + ":00 AM");
+    }
+
+    function openPlot() {
+        window.open(this.id, "_blank");
+    }
+
+    function update(plots) {
+        var hour = new Date().getHours();
+        for (var i = 0; i < plots.length; i++) {
+            var plot = plots[i];
+            var visible = hour >= plot.start && hour < plot.end;
+            if (visible === plot.visible) {
+                continue;
+            }
+            plot.visible = visible;
+            plot.el.classList.toggle("unavailable", !visible);
+            // Plots drawn while hidden need a resize once they are shown
+            if (visible && window.Plotly) {
+                var graphs = plot.el.querySelectorAll(".js-plotly-plot");
+                for (var j = 0; j < graphs.length; j++) {
+                    window.Plotly.Plots.resize(graphs[j]);
+                }
+            }
+        }
+    }
+
+    function init() {
+        var nodes = document.querySelectorAll(".plot-container[data-start]");
+        var plots = [];
+        for (var i = 0; i < nodes.length; i++) {
+            var el = nodes[i];
+            var start = parseInt(el.dataset.start, 10);
+            var end = parseInt(el.dataset.end, 10);
+
+            var message = document.createElement("h3");
+            message.className = "unavailable-message";
+            message.textContent = "This plot is available between " + formatHour(start) + " and " + formatHour(end) + " IST";
+            el.appendChild(message);
+            el.addEventListener("click", openPlot);
+
+            plots.push({el: el, start: start, end: end, visible: null});
+        }
+        update(plots);
+        setInterval(function () { update(plots); }, REFRESH_MS);
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", init);
+    } else {
+        init();
+    }
+})();
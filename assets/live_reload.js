@@ -0,0 +1,25 @@
+// Live reload for watch mode (see watch.py), appended to the runtime only
+// when the dashboard is served by the watcher. Polls the build version and
+// reloads the page when a rebuild has finished.
+//
+// Keep statements terminated with semicolons and avoid regex literals:
+// assets.py minifies this file with a simple tokenizer.
+(function () {
+    var POLL_MS = 1000;
+    var version = null;
+
+    function poll() {
+        fetch("/__version", {cache: "no-store"})
+            .then(function (response) { return response.text(); })
+            .then(function (current) {
+                if (version !== null && current !== version) {
+                    window.location.reload();
+                }
+                version = current;
+            })
+            .catch(function () {});
+    }
+
+    poll();
+    setInterval(poll, POLL_MS);
+})();
@@ -0,0 +1,640 @@
+# <----------Execution Backends---------->
+
+# The figure data queries of the dashboard, implemented once per engine.
+# Every backend takes the cleaned pandas frames and returns pandas objects
+# with the same shape, so the plotting code does not care which engine ran.
+#
+#   pandas  - the original single-threaded implementation (default)
+#   duckdb  - embedded, multi-threaded SQL engine
+#   polars  - multi-threaded, vectorized DataFrame engine
+#
+# Select one with the DASHBOARD_BACKEND environment variable, and run
+# `python backends.py` to check that every installed backend agrees.
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from predicates import PredicateIndex
+
+
+BACKEND_NAMES = ('pandas', 'duckdb', 'polars')
+
+# Strings that pd.read_csv treats as missing; the other engines are told the same
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Time buckets of the Figure 14 / Figure 16 queries: pandas frequency, SQL
+# date_trunc part and Polars truncate interval. 'day' feeds the time-series
+# pyramid (see timeseries.py).
+TIME_BUCKETS = {
+    'day': ('D', 'day', '1d'),
+    'month': ('MS', 'month', '1mo'),
+}
+
+# Figure 14 and Figure 16 filter on these prefixes
+FIG14_EXCLUDED_APP_PREFIXES = ('x', 'y', 'z', 'X', 'Y', 'Z')
+FIG14_CATEGORY_PREFIXES = ('E', 'C', 'B')
+FIG16_CATEGORY_PREFIXES = ('T', 'P')
+
+# Category labels shown in Figures 14, 15 and 16
+FIG14_TRANSLATIONS = {
+    'BEAUTY': 'सौंदर्य (Beauty)',
+    'BUSINESS': 'வணிகம் (Business)',
+    'DATING': 'Dating'
+}
+FIG15_TRANSLATIONS = {
+    'BEAUTY': 'सौंदर्य (Beauty)',
+    'BUSINESS': 'வணிகம் (Business)',
+    'DATING': 'Dating (German)'
+}
+FIG16_TRANSLATIONS = {
+    'TRAVEL_AND_LOCAL': 'Voyage et local (Travel & Local)',   # French
+    'PRODUCTIVITY': 'Productividad (Productivity)',           # Spanish
+    'PHOTOGRAPHY': '写真 (Photography)'                        # Japanese
+}
+FIG15_CATEGORIES = ['GAME', 'BEAUTY', 'BUSINESS', 'COMICS', 'COMMUNICATION', 'DATING', 'ENTERTAINMENT', 'SOCIAL', 'EVENTS']
+FIG15_COLUMNS = ['App', 'Category', 'Rating', 'Reviews', 'Size', 'Installs',
+                 'Sentiment_Subjectivity', 'Category_Translated']
+
+
+# Sort a count/sum series by value, breaking ties on the index so that every
+# backend picks the same top-n rows
+def _top(series, n):
+    series = series.sort_index().sort_values(ascending=False, kind='stable')
+    return series.head(n) if n is not None else series
+
+
+# Keep every CSV column as text, like the other engines: validation does the
+# type conversion, and an inferred float column would turn '159' into '159.0'
+def _read_path(path):
+    if str(path).endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=CSV_NA_VALUES)
+
+
+class PandasBackend:
+    name = 'pandas'
+
+    def __init__(self):
+        self._predicate_index = None
+
+    # Predicate masks are cached per apps frame and shared by every figure
+    def predicates(self, apps_df):
+        if self._predicate_index is None or self._predicate_index.df is not apps_df:
+            self._predicate_index = PredicateIndex(apps_df)
+        return self._predicate_index
+
+    def read_apps(self, path):
+        return _read_path(path)
+
+    def category_counts(self, apps_df, n=10):
+        return _top(apps_df['Category'].value_counts(), n)
+
+    def type_counts(self, apps_df):
+        return _top(apps_df['Type'].value_counts(), None)
+
+    def installs_by_category(self, apps_df, n=10):
+        return _top(apps_df.groupby('Category')['Installs'].sum(), n)
+
+    def revenue_by_category(self, apps_df, n=10):
+        return _top(apps_df.groupby('Category')['Revenue'].sum(), n)
+
+    # Figure 11: categories with an average rating >= 4.0 among large apps
+    # updated in the given month, top 10 by installs
+    def fig11_data(self, apps_df, month=1):
+        p = self.predicates(apps_df)
+        filter1_df = apps_df[p.compare('Size', '>=', 10) & p.month('Last Updated', month)]
+        avg_rating = filter1_df.groupby('Category')['Rating'].mean()
+        categories_to_keep = avg_rating[avg_rating >= 4.0].index
+        filter2_df = filter1_df[filter1_df['Category'].isin(categories_to_keep)]
+        top_categories = _top(filter2_df.groupby('Category')['Installs'].sum(), 10).index
+        final_df = filter2_df[filter2_df['Category'].isin(top_categories)]
+        chart_data = final_df.groupby('Category').agg(
+            Average_Rating=('Rating', 'mean'),
+            Total_Reviews=('Reviews', 'sum')
+        ).reset_index()
+        return chart_data.sort_values(['Average_Rating', 'Category'], ascending=[False, True], ignore_index=True)
+
+    # Figure 13: average installs and revenue of free and paid apps in the
+    # top 3 categories
+    def fig13_data(self, apps_df):
+        p = self.predicates(apps_df)
+        top_3_categories = self.category_counts(apps_df, 3).index
+        common = (
+            p.compare('Installs', '>=', 10000) &
+            p.compare('Android_Ver_Numeric', '>', 4.0) &
+            p.compare('Size', '>', 15) &
+            p.isin('Content Rating', ['Everyone']) &
+            p.str_len('App', '<=', 30) &
+            p.isin('Category', top_3_categories)
+        )
+        free_apps = apps_df[common & p.isin('Type', ['Free'])]
+        paid_apps = apps_df[common & p.isin('Type', ['Paid']) & p.compare('Revenue', '>=', 10000)]
+        filtered_df = pd.concat([free_apps, paid_apps], ignore_index=True)
+        return filtered_df.groupby(['Category', 'Type'])[['Installs', 'Revenue']].mean().reset_index()
+
+    # Figure 14: installs per category and time bucket (monthly by default).
+    # Growth and running totals are computed by the time-series pyramid.
+    def fig14_data(self, apps_df, translation_map=FIG14_TRANSLATIONS, bucket='month'):
+        p = self.predicates(apps_df)
+        df_filtered = apps_df[
+            p.compare('Reviews', '>', 500) &
+            ~p.startswith('App', FIG14_EXCLUDED_APP_PREFIXES) &
+            ~p.contains('App', 's', case=False) &
+            p.startswith('Category', FIG14_CATEGORY_PREFIXES)
+        ]
+        return self._installs_per_bucket(df_filtered, translation_map, bucket)
+
+    # Figure 16: installs per category and time bucket
+    def fig16_data(self, apps_df, translation_map=FIG16_TRANSLATIONS, bucket='month'):
+        p = self.predicates(apps_df)
+        df_filtered = apps_df[
+            p.compare('Rating', '>=', 4.2) &
+            ~p.contains('App', r'\d') &
+            p.startswith('Category', FIG16_CATEGORY_PREFIXES) &
+            p.compare('Reviews', '>', 1000) &
+            p.between('Size', 20, 80)
+        ]
+        return self._installs_per_bucket(df_filtered, translation_map, bucket)
+
+    # Installs per category and time bucket (monthly by default)
+    def _installs_per_bucket(self, df_filtered, translation_map, bucket='month'):
+        df_filtered = df_filtered.assign(
+            Category_Translated=df_filtered['Category'].map(lambda x: translation_map.get(x, x))
+        )
+        df_agg = df_filtered.groupby(
+            ['Category_Translated', pd.Grouper(key='Last Updated', freq=TIME_BUCKETS[bucket][0])]
+        )['Installs'].sum().reset_index()
+        return df_agg.sort_values(by=['Category_Translated', 'Last Updated'], ignore_index=True)
+
+    # Figure 15: popular, subjective-review apps in the selected categories
+    def fig15_data(self, apps_df, reviews_df, categories=FIG15_CATEGORIES, translation_map=FIG15_TRANSLATIONS):
+        # App-level filters run on the predicate index before the merge
+        p = self.predicates(apps_df)
+        selected_apps = apps_df[
+            p.compare('Rating', '>', 3.5) &
+            p.isin('Category', categories) &
+            p.compare('Reviews', '>', 500) &
+            ~p.contains('App', 's', case=False) &
+            p.compare('Installs', '>', 50000) &
+            p.notna('Size')
+        ]
+        avg_subjectivity_df = reviews_df.groupby('App')['Sentiment_Subjectivity'].mean().reset_index()
+        df_for_plot15 = pd.merge(selected_apps, avg_subjectivity_df, on='App', how='inner')
+        df_filtered_15 = df_for_plot15[df_for_plot15['Sentiment_Subjectivity'] > 0.5]
+        df_filtered_15 = df_filtered_15[FIG15_COLUMNS[:-1]].reset_index(drop=True)
+        df_filtered_15['Category_Translated'] = df_filtered_15['Category'].map(
+            lambda x: translation_map.get(x, x)
+        )
+        return df_filtered_15
+
+
+# Build a SQL CASE expression mapping categories through a translation map
+def _sql_translate(column, translation_map):
+    if not translation_map:
+        return column
+    cases = ' '.join(
+        f"WHEN {column} = {_sql_str(k)} THEN {_sql_str(v)}" for k, v in translation_map.items()
+    )
+    return f"CASE {cases} ELSE {column} END"
+
+
+def _sql_str(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+# An empty list gives (NULL), which matches no row like an empty isin()
+def _sql_in(values):
+    return '(' + (', '.join(_sql_str(v) for v in values) or 'NULL') + ')'
+
+
+def _sql_startswith(column, prefixes):
+    return '(' + ' OR '.join(f"starts_with({column}, {_sql_str(p)})" for p in prefixes) + ')'
+
+
+class DuckDBBackend:
+    name = 'duckdb'
+
+    def __init__(self, threads=None):
+        import duckdb
+        self.con = duckdb.connect()
+        if threads:
+            self.con.execute(f"SET threads TO {int(threads)}")
+
+    # Run a query against the registered pandas frames and return a DataFrame
+    def _query(self, sql, **frames):
+        for name, df in frames.items():
+            self.con.register(name, df)
+        try:
+            return self.con.execute(sql).df()
+        finally:
+            for name in frames:
+                self.con.unregister(name)
+
+    def _series(self, df, index, value, name):
+        series = df.set_index(index)[value]
+        series.index.name = index
+        series.name = name
+        return series
+
+    def read_apps(self, path):
+        path = str(path)
+        if path.endswith('.parquet'):
+            return self.con.execute("SELECT * FROM read_parquet(?)", [path]).df()
+        # Keep every column as text; validation does the type conversion
+        return self.con.execute(
+            "SELECT * FROM read_csv(?, header = true, all_varchar = true, null_padding = true, nullstr = ?)",
+            [path, CSV_NA_VALUES]
+        ).df()
+
+    def category_counts(self, apps_df, n=10):
+        df = self._query(f"""
+            SELECT "Category", count(*) AS cnt FROM apps
+            WHERE "Category" IS NOT NULL
+            GROUP BY 1 ORDER BY cnt DESC, 1 LIMIT {int(n)}
+        """, apps=apps_df)
+        return self._series(df, 'Category', 'cnt', 'count')
+
+    def type_counts(self, apps_df):
+        df = self._query("""
+            SELECT "Type", count(*) AS cnt FROM apps
+            WHERE "Type" IS NOT NULL
+            GROUP BY 1 ORDER BY cnt DESC, 1
+        """, apps=apps_df)
+        return self._series(df, 'Type', 'cnt', 'count')
+
+    def installs_by_category(self, apps_df, n=10):
+        df = self._query(f"""
+            SELECT "Category", sum("Installs") AS total FROM apps
+            GROUP BY 1 ORDER BY total DESC, 1 LIMIT {int(n)}
+        """, apps=apps_df)
+        return self._series(df, 'Category', 'total', 'Installs').astype(apps_df['Installs'].dtype)
+
+    def revenue_by_category(self, apps_df, n=10):
+        df = self._query(f"""
+            SELECT "Category", sum("Revenue") AS total FROM apps
+            GROUP BY 1 ORDER BY total DESC, 1 LIMIT {int(n)}
+        """, apps=apps_df)
+        return self._series(df, 'Category', 'total', 'Revenue')
+
+    def fig11_data(self, apps_df, month=1):
+        return self._query(f"""
+            WITH filter1 AS (
+                SELECT * FROM apps
+                WHERE "Size" >= 10 AND month("Last Updated") = {int(month)}
+            ),
+            kept AS (
+                SELECT "Category" FROM filter1
+                GROUP BY 1 HAVING avg("Rating") >= 4.0
+            ),
+            top_categories AS (
+                SELECT "Category" FROM filter1
+                WHERE "Category" IN (SELECT "Category" FROM kept)
+                GROUP BY 1 ORDER BY sum("Installs") DESC, 1 LIMIT 10
+            )
+            SELECT "Category",
+                   avg("Rating") AS "Average_Rating",
+                   sum("Reviews") AS "Total_Reviews"
+            FROM filter1
+            WHERE "Category" IN (SELECT "Category" FROM top_categories)
+            GROUP BY 1
+            ORDER BY "Average_Rating" DESC, 1
+        """, apps=apps_df).astype({'Total_Reviews': apps_df['Reviews'].dtype})
+
+    def fig13_data(self, apps_df):
+        top_3 = list(self.category_counts(apps_df, 3).index)
+        return self._query(f"""
+            SELECT "Category", "Type",
+                   avg("Installs") AS "Installs",
+                   avg("Revenue") AS "Revenue"
+            FROM apps
+            WHERE "Installs" >= 10000
+              AND "Android_Ver_Numeric" > 4.0
+              AND "Size" > 15
+              AND "Content Rating" = 'Everyone'
+              AND length("App") <= 30
+              AND "Category" IN {_sql_in(top_3)}
+              AND ("Type" = 'Free' OR ("Type" = 'Paid' AND "Revenue" >= 10000))
+            GROUP BY 1, 2
+            ORDER BY 1, 2
+        """, apps=apps_df)
+
+    def fig14_data(self, apps_df, translation_map=FIG14_TRANSLATIONS, bucket='month'):
+        excluded = ' OR '.join(f"starts_with(\"App\", {_sql_str(p)})" for p in FIG14_EXCLUDED_APP_PREFIXES)
+        where = f"""
+            "Reviews" > 500
+            AND NOT ({excluded})
+            AND NOT contains(lower("App"), 's')
+            AND {_sql_startswith('"Category"', FIG14_CATEGORY_PREFIXES)}
+        """
+        return self._installs_per_bucket(apps_df, where, translation_map, bucket)
+
+    def fig16_data(self, apps_df, translation_map=FIG16_TRANSLATIONS, bucket='month'):
+        where = f"""
+            "Rating" >= 4.2
+            AND NOT regexp_matches("App", '\\d')
+            AND {_sql_startswith('"Category"', FIG16_CATEGORY_PREFIXES)}
+            AND "Reviews" > 1000
+            AND "Size" BETWEEN 20 AND 80
+        """
+        return self._installs_per_bucket(apps_df, where, translation_map, bucket)
+
+    def _installs_per_bucket(self, apps_df, where, translation_map, bucket):
+        df = self._query(f"""
+            SELECT {_sql_translate('"Category"', translation_map)} AS "Category_Translated",
+                   CAST(date_trunc('{TIME_BUCKETS[bucket][1]}', "Last Updated") AS TIMESTAMP) AS "Last Updated",
+                   sum("Installs") AS "Installs"
+            FROM apps
+            WHERE {where} AND "Last Updated" IS NOT NULL
+            GROUP BY 1, 2
+            ORDER BY 1, 2
+        """, apps=apps_df)
+        df['Installs'] = df['Installs'].astype(apps_df['Installs'].dtype)
+        df['Last Updated'] = df['Last Updated'].astype(apps_df['Last Updated'].dtype)
+        return df
+
+    def fig15_data(self, apps_df, reviews_df, categories=FIG15_CATEGORIES, translation_map=FIG15_TRANSLATIONS):
+        apps_df = apps_df.assign(_order=np.arange(len(apps_df)))
+        return self._query(f"""
+            WITH subjectivity AS (
+                SELECT "App", avg("Sentiment_Subjectivity") AS "Sentiment_Subjectivity"
+                FROM reviews GROUP BY 1
+            )
+            SELECT a."App", a."Category", a."Rating", a."Reviews", a."Size", a."Installs",
+                   s."Sentiment_Subjectivity",
+                   {_sql_translate('a."Category"', translation_map)} AS "Category_Translated"
+            FROM apps a JOIN subjectivity s ON a."App" = s."App"
+            WHERE a."Rating" > 3.5
+              AND a."Category" IN {_sql_in(categories)}
+              AND a."Reviews" > 500
+              AND NOT contains(lower(a."App"), 's')
+              AND s."Sentiment_Subjectivity" > 0.5
+              AND a."Installs" > 50000
+              AND a."Size" IS NOT NULL AND NOT isnan(a."Size")
+            ORDER BY a._order
+        """, apps=apps_df, reviews=reviews_df[['App', 'Sentiment_Subjectivity']])
+
+
+class PolarsBackend:
+    name = 'polars'
+
+    def __init__(self):
+        import polars as pl
+        self.pl = pl
+        self._source = None
+        self._frame = None
+
+    # Convert the pandas frame once and reuse it while the same frame is queried
+    def _lazy(self, apps_df):
+        if self._source is not apps_df:
+            self._frame = self.pl.from_pandas(apps_df, nan_to_null=True)
+            self._source = apps_df
+        return self._frame.lazy()
+
+    def _series(self, df, index, value, name):
+        pdf = df.to_pandas()
+        series = pdf.set_index(index)[value]
+        series.name = name
+        return series
+
+    def _startswith(self, column, prefixes):
+        pl = self.pl
+        expr = pl.lit(False)
+        for prefix in prefixes:
+            expr = expr | pl.col(column).str.starts_with(prefix)
+        return expr
+
+    def read_apps(self, path):
+        pl = self.pl
+        path = str(path)
+        if path.endswith('.parquet'):
+            return pl.scan_parquet(path).collect().to_pandas()
+        # Keep every column as text; validation does the type conversion
+        return pl.scan_csv(path, infer_schema=False, null_values=CSV_NA_VALUES).collect().to_pandas()
+
+    def _top(self, apps_df, key, agg, n):
+        pl = self.pl
+        df = (
+            self._lazy(apps_df)
+            .filter(pl.col(key).is_not_null())
+            .group_by(key).agg(agg.alias('value'))
+            .sort(['value', key], descending=[True, False])
+        )
+        if n is not None:
+            df = df.head(n)
+        return df.collect()
+
+    def category_counts(self, apps_df, n=10):
+        df = self._top(apps_df, 'Category', self.pl.len(), n)
+        return self._series(df, 'Category', 'value', 'count').astype('int64')
+
+    def type_counts(self, apps_df):
+        df = self._top(apps_df, 'Type', self.pl.len(), None)
+        return self._series(df, 'Type', 'value', 'count').astype('int64')
+
+    def installs_by_category(self, apps_df, n=10):
+        df = self._top(apps_df, 'Category', self.pl.col('Installs').sum(), n)
+        return self._series(df, 'Category', 'value', 'Installs').astype(apps_df['Installs'].dtype)
+
+    def revenue_by_category(self, apps_df, n=10):
+        df = self._top(apps_df, 'Category', self.pl.col('Revenue').sum(), n)
+        return self._series(df, 'Category', 'value', 'Revenue')
+
+    def fig11_data(self, apps_df, month=1):
+        pl = self.pl
+        filter1 = self._lazy(apps_df).filter(
+            (pl.col('Size') >= 10) & (pl.col('Last Updated').dt.month() == month)
+        )
+        kept = filter1.group_by('Category').agg(pl.col('Rating').mean()).filter(pl.col('Rating') >= 4.0)
+        filter2 = filter1.join(kept.select('Category'), on='Category', how='semi')
+        top_categories = (
+            filter2.group_by('Category').agg(pl.col('Installs').sum())
+            .sort(['Installs', 'Category'], descending=[True, False]).head(10)
+        )
+        df = (
+            filter2.join(top_categories.select('Category'), on='Category', how='semi')
+            .group_by('Category')
+            .agg(pl.col('Rating').mean().alias('Average_Rating'),
+                 pl.col('Reviews').sum().alias('Total_Reviews'))
+            .sort(['Average_Rating', 'Category'], descending=[True, False])
+            .collect()
+        )
+        return df.to_pandas().astype({'Total_Reviews': apps_df['Reviews'].dtype})
+
+    def fig13_data(self, apps_df):
+        pl = self.pl
+        top_3 = list(self.category_counts(apps_df, 3).index)
+        df = (
+            self._lazy(apps_df)
+            .filter(
+                (pl.col('Installs') >= 10000) &
+                (pl.col('Android_Ver_Numeric') > 4.0) &
+                (pl.col('Size') > 15) &
+                (pl.col('Content Rating') == 'Everyone') &
+                (pl.col('App').str.len_chars() <= 30) &
+                pl.col('Category').is_in(top_3) &
+                ((pl.col('Type') == 'Free') |
+                 ((pl.col('Type') == 'Paid') & (pl.col('Revenue') >= 10000)))
+            )
+            .group_by(['Category', 'Type'])
+            .agg(pl.col('Installs').mean(), pl.col('Revenue').mean())
+            .sort(['Category', 'Type'])
+            .collect()
+        )
+        return df.to_pandas()
+
+    def fig14_data(self, apps_df, translation_map=FIG14_TRANSLATIONS, bucket='month'):
+        pl = self.pl
+        predicate = (
+            (pl.col('Reviews') > 500) &
+            ~self._startswith('App', FIG14_EXCLUDED_APP_PREFIXES) &
+            ~pl.col('App').str.to_lowercase().str.contains('s', literal=True) &
+            self._startswith('Category', FIG14_CATEGORY_PREFIXES)
+        )
+        return self._installs_per_bucket(apps_df, predicate, translation_map, bucket)
+
+    def fig16_data(self, apps_df, translation_map=FIG16_TRANSLATIONS, bucket='month'):
+        pl = self.pl
+        predicate = (
+            (pl.col('Rating') >= 4.2) &
+            ~pl.col('App').str.contains(r'\d') &
+            self._startswith('Category', FIG16_CATEGORY_PREFIXES) &
+            (pl.col('Reviews') > 1000) &
+            pl.col('Size').is_between(20, 80)
+        )
+        return self._installs_per_bucket(apps_df, predicate, translation_map, bucket)
+
+    def _installs_per_bucket(self, apps_df, predicate, translation_map, bucket):
+        pl = self.pl
+        df = (
+            self._lazy(apps_df)
+            .filter(predicate & pl.col('Last Updated').is_not_null())
+            .with_columns(
+                pl.col('Category').replace(translation_map).alias('Category_Translated'),
+                pl.col('Last Updated').dt.truncate(TIME_BUCKETS[bucket][2]),
+            )
+            .group_by(['Category_Translated', 'Last Updated'])
+            .agg(pl.col('Installs').sum())
+            .sort(['Category_Translated', 'Last Updated'])
+            .collect()
+        )
+        df = df.to_pandas()
+        df['Installs'] = df['Installs'].astype(apps_df['Installs'].dtype)
+        return df
+
+    def fig15_data(self, apps_df, reviews_df, categories=FIG15_CATEGORIES, translation_map=FIG15_TRANSLATIONS):
+        pl = self.pl
+        subjectivity = (
+            pl.from_pandas(reviews_df[['App', 'Sentiment_Subjectivity']]).lazy()
+            .group_by('App').agg(pl.col('Sentiment_Subjectivity').mean())
+        )
+        df = (
+            self._lazy(apps_df)
+            .with_row_index('_order')
+            .join(subjectivity, on='App', how='inner')
+            .filter(
+                (pl.col('Rating') > 3.5) &
+                pl.col('Category').is_in(list(categories)) &
+                (pl.col('Reviews') > 500) &
+                ~pl.col('App').str.to_lowercase().str.contains('s', literal=True) &
+                (pl.col('Sentiment_Subjectivity') > 0.5) &
+                (pl.col('Installs') > 50000) &
+                pl.col('Size').is_not_null()
+            )
+            .sort('_order')
+            .with_columns(pl.col('Category').replace(translation_map).alias('Category_Translated'))
+            .select(FIG15_COLUMNS)
+            .collect()
+        )
+        return df.to_pandas()
+
+
+def get_backend(name=None):
+    name = name or os.environ.get('DASHBOARD_BACKEND', 'pandas')
+    if name == 'pandas':
+        return PandasBackend()
+    if name == 'duckdb':
+        return DuckDBBackend()
+    if name == 'polars':
+        return PolarsBackend()
+    raise ValueError(f"Unknown backend {name!r}, expected one of {BACKEND_NAMES}")
+
+
+# <----------Parity Check---------->
+
+# Every figure data query with its default arguments, plus the filter
+# arguments the figure API accepts (all months of Fig 11, empty, single and
+# unknown categories of Fig 15). Name -> function of a backend.
+def parity_queries(apps_df, reviews_df):
+    queries = {
+        'category_counts': lambda b: b.category_counts(apps_df),
+        'type_counts': lambda b: b.type_counts(apps_df),
+        'installs_by_category': lambda b: b.installs_by_category(apps_df),
+        'revenue_by_category': lambda b: b.revenue_by_category(apps_df),
+        'fig11_data': lambda b: b.fig11_data(apps_df),
+        'fig13_data': lambda b: b.fig13_data(apps_df),
+        'fig14_data': lambda b: b.fig14_data(apps_df),
+        'fig16_data': lambda b: b.fig16_data(apps_df),
+        'fig14_data_daily': lambda b: b.fig14_data(apps_df, bucket='day'),
+        'fig16_data_daily': lambda b: b.fig16_data(apps_df, bucket='day'),
+        'fig15_data': lambda b: b.fig15_data(apps_df, reviews_df),
+    }
+    for month in range(1, 13):
+        queries[f"fig11_data_month_{month}"] = lambda b, month=month: b.fig11_data(apps_df, month=month)
+    for label, categories in (('empty', []), ('single', ['GAME']), ('unknown', ['NOT_A_CATEGORY'])):
+        queries[f"fig15_data_{label}"] = lambda b, categories=categories: b.fig15_data(apps_df, reviews_df, categories)
+    return queries
+
+
+# Load and clean the data on each backend, run every figure data query on the
+# cleaned frame and compare both with pandas. Returns a list of
+# (backend, step, error) tuples; an empty list means full parity.
+def check_parity(apps_path='Play Store Data.csv', reviews_path='User Reviews.csv', backends=BACKEND_NAMES[1:]):
+    from cleaning import load_data, clean_apps, clean_reviews
+
+    reference = PandasBackend()
+    apps_df, reviews_df = load_data(apps_path, reviews_path, reference)
+    apps_df = clean_apps(apps_df)
+    reviews_df = clean_reviews(reviews_df)
+
+    queries = parity_queries(apps_df, reviews_df)
+    expected = {name: query(reference) for name, query in queries.items()}
+
+    failures = []
+    for backend_name in backends:
+        try:
+            backend = get_backend(backend_name)
+        except ImportError as exc:
+            failures.append((backend_name, None, f"not installed: {exc}"))
+            continue
+        steps = {'clean_apps': (apps_df, lambda: clean_apps(backend.read_apps(apps_path)))}
+        steps.update({name: (expected[name], lambda query=query: query(backend)) for name, query in queries.items()})
+        for name, (reference_result, run) in steps.items():
+            try:
+                _assert_same(reference_result, run())
+            except AssertionError as exc:
+                failures.append((backend_name, name, str(exc)))
+    return failures
+
+
+def _assert_same(expected, actual):
+    if isinstance(expected, pd.Series):
+        expected = expected.reset_index().set_axis(['key', 'value'], axis=1)
+        actual = actual.reset_index().set_axis(['key', 'value'], axis=1)
+    pd.testing.assert_frame_equal(
+        expected.reset_index(drop=True), actual.reset_index(drop=True), check_dtype=False
+    )
+
+
+if __name__ == '__main__':
+    import sys
+
+    failures = check_parity()
+    for backend_name, step, error in failures:
+        print(f"[{backend_name}] {step}: {error}")
+    print('All backends agree' if not failures else f"{len(failures)} parity failure(s)")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,193 @@
+# <----------Batch Dashboards---------->
+
+# Builds one dashboard per segment from a JSON configuration, in a single
+# process tree. The shared work is done once: each distinct Play Store file
+# is loaded and cleaned once, each distinct reviews file is loaded, cleaned
+# and scored once, and plotly.js is written once to the output root and
+# referenced by every page. Only the per-segment figure building and file
+# writing is fanned out across worker processes.
+#
+#   {
+#     "output": "dashboards",
+#     "segments": [
+#       {"name": "games", "filters": {"Category": ["GAME", "FAMILY"]}},
+#       {"name": "paid", "filters": {"Type": ["Paid"]}},
+#       {"name": "2026", "apps": "exports/2026.csv", "reviews": "exports/2026-reviews.csv"}
+#     ]
+#   }
+#
+# Segment filters map an apps column to its allowed values; the segment's
+# reviews are those of its apps. "apps", "reviews" and "output" default to
+# the top-level values.
+#
+#   python batch.py segments.json --workers 4 --backend duckdb
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from backends import get_backend
+from cleaning import clean_apps, clean_reviews
+from dashboard import build_dashboard
+from genres import GenreIndex
+from pipeline import DashboardData, score_sentiment
+
+
+class Segment:
+
+    def __init__(self, name, apps, reviews, output, filters=None):
+        self.name = name
+        self.apps = apps
+        self.reviews = reviews
+        self.output = output
+        # Apps column -> allowed values
+        self.filters = filters or {}
+
+
+def load_segments(config):
+    defaults = {
+        'apps': config.get('apps', 'Play Store Data.csv'),
+        'reviews': config.get('reviews', 'User Reviews.csv'),
+    }
+    output = config.get('output', 'dashboards')
+
+    segments = []
+    for entry in config['segments']:
+        unknown = set(entry) - {'name', 'apps', 'reviews', 'output', 'filters'}
+        if unknown:
+            raise ValueError(f"Unknown key(s) in segment {entry.get('name')!r}: {', '.join(sorted(unknown))}")
+        filters = {
+            column: values if isinstance(values, list) else [values]
+            for column, values in entry.get('filters', {}).items()
+        }
+        segments.append(Segment(
+            entry['name'],
+            entry.get('apps', defaults['apps']),
+            entry.get('reviews', defaults['reviews']),
+            entry.get('output', os.path.join(output, entry['name'])),
+            filters,
+        ))
+
+    names = [segment.name for segment in segments]
+    if len(set(names)) != len(names):
+        raise ValueError("Segment names must be unique")
+    return segments, output
+
+
+# Loaded, cleaned and scored inputs, each distinct file processed once
+class SharedInputs:
+
+    def __init__(self, backend, output):
+        self.backend = backend
+        self.output = output
+        self._apps = {}
+        self._reviews = {}
+
+    def apps(self, path):
+        if path not in self._apps:
+            self._apps[path] = clean_apps(self.backend.read_apps(path), self.quarantine_path(path))
+        return self._apps[path]
+
+    # Malformed rows of an apps file are written next to the dashboards
+    def quarantine_path(self, path):
+        return os.path.join(self.output, os.path.splitext(os.path.basename(path))[0] + '.quarantine.csv')
+
+    def reviews(self, path):
+        if path not in self._reviews:
+            self._reviews[path] = score_sentiment(clean_reviews(pd.read_csv(path)))
+        return self._reviews[path]
+
+    def segment_frames(self, segment):
+        apps_df = self.apps(segment.apps)
+        for column, values in segment.filters.items():
+            if column not in apps_df.columns:
+                raise ValueError(f"Segment {segment.name!r} filters on unknown column {column!r}")
+            apps_df = apps_df[apps_df[column].isin(values)]
+        reviews_df = self.reviews(segment.reviews)
+        if segment.filters:
+            reviews_df = reviews_df[reviews_df['App'].isin(apps_df['App'])]
+        return apps_df.copy(), reviews_df.copy()
+
+
+# Worker: figure building and writing for one segment. Backends keep
+# per-frame caches, so each segment gets its own backend instance.
+def build_segment(name, apps_df, reviews_df, backend_name, output, plotlyjs):
+    start = time.perf_counter()
+    data = DashboardData(apps_df, reviews_df, get_backend(backend_name), GenreIndex.from_series(apps_df['Genres']))
+    dashboard_path = build_dashboard(data, output, plotlyjs)
+    return name, dashboard_path, time.perf_counter() - start
+
+
+# Write plotly.js once for all dashboards
+def write_plotlyjs(output):
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, 'plotly.min.js')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+    return path
+
+
+# Build every segment's dashboard. Returns {segment name: dashboard path} and
+# {segment name: error message} for the segments that failed.
+def run_batch(config, backend=None, workers=None):
+    segments, output = load_segments(config)
+    backend = backend or get_backend(config.get('backend'))
+    plotlyjs_path = write_plotlyjs(output)
+    inputs = SharedInputs(backend, output)
+
+    jobs = []
+    errors = {}
+    for segment in segments:
+        try:
+            apps_df, reviews_df = inputs.segment_frames(segment)
+        except (OSError, ValueError) as exc:
+            errors[segment.name] = str(exc)
+            continue
+        if apps_df.empty:
+            errors[segment.name] = "no apps match the segment filters"
+            continue
+        plotlyjs = os.path.relpath(plotlyjs_path, segment.output).replace(os.sep, '/')
+        jobs.append((segment.name, apps_df, reviews_df, backend.name, segment.output, plotlyjs))
+
+    results = {}
+    if workers == 1:
+        for job in jobs:
+            name, dashboard_path, seconds = build_segment(*job)
+            results[name] = dashboard_path
+            print(f"{name}: {dashboard_path} ({seconds:.1f}s)")
+        return results, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_segment, *job): job[0] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                name, dashboard_path, seconds = future.result()
+            except Exception as exc:
+                errors[futures[future]] = f"{type(exc).__name__}: {exc}"
+                continue
+            results[name] = dashboard_path
+            print(f"{name}: {dashboard_path} ({seconds:.1f}s)")
+    return results, errors
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build one dashboard per segment with shared loading and scoring.')
+    parser.add_argument('config', help='JSON file with the segment configurations')
+    parser.add_argument('--backend', default=None, help='pandas, duckdb or polars (default: config, DASHBOARD_BACKEND or pandas)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per CPU)')
+    args = parser.parse_args()
+
+    with open(args.config, encoding='utf-8') as f:
+        config = json.load(f)
+
+    start = time.perf_counter()
+    results, errors = run_batch(config, get_backend(args.backend or config.get('backend')), args.workers)
+    for name, message in errors.items():
+        print(f"{name}: FAILED ({message})")
+    print(f"Built {len(results)} of {len(results) + len(errors)} dashboards in {time.perf_counter() - start:.1f}s")
+    raise SystemExit(1 if errors else 0)
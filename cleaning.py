@@ -0,0 +1,74 @@
+# <----------Loading and Cleaning---------->
+
+# Loading and cleaning of the Play Store and User Reviews datasets, shared by
+# the dashboard script and the backend parity check. Files are read on the
+# selected execution backend (see backends.py); column checks and type
+# conversions are done by the validation stage (see validation.py).
+
+import numpy as np
+import pandas as pd
+
+from backends import get_backend
+from validation import APP_RULES, validate
+
+
+def load_data(apps_path='Play Store Data.csv', reviews_path='User Reviews.csv', backend=None):
+    backend = backend or get_backend()
+    apps_df = backend.read_apps(apps_path)
+    reviews_df = pd.read_csv(reviews_path)
+    return apps_df, reviews_df
+
+
+# Create a new column 'Rating_Group' based on the 'Rating' column
+def rating_group(rating):
+    if rating >= 4:
+        return 'Top rated app'
+    elif rating >= 3:
+        return 'Above average'
+    elif rating >= 2:
+        return 'Average'
+    else:
+        return 'Below average'
+
+
+def clean_apps(apps_df, quarantine_path=None):
+    raw_df = apps_df
+
+    # Handling missing values and duplicates
+    apps_df = apps_df.dropna(subset=['Rating']).copy()
+    for column in apps_df.columns:
+        apps_df[column] = apps_df[column].fillna(apps_df[column].mode()[0])
+    apps_df = apps_df.drop_duplicates()
+
+    # Check every column and set malformed rows aside (e.g. the shifted row
+    # with a rating of 19). 'Rating', 'Reviews', 'Size' (MB), 'Installs',
+    # 'Price' and 'Last Updated' come out typed.
+    result = validate(apps_df, APP_RULES, raw_df)
+    apps_df = result.valid_df
+    if quarantine_path is not None:
+        result.quarantine_df.to_csv(quarantine_path, index=False)
+        if len(result.quarantine_df):
+            print(f"Quarantined {len(result.quarantine_df)} malformed row(s) to {quarantine_path}")
+
+    # Apply log transformation to 'Installs' and 'Reviews' columns
+    apps_df['Log_Installs'] = np.log1p(apps_df['Installs'])
+    apps_df['Log_Riviews'] = np.log1p(apps_df['Reviews'])
+
+    apps_df['Rating_Group'] = apps_df['Rating'].apply(rating_group)
+
+    # Create a new column 'Revenue' by multiplying 'Installs' and 'Price'
+    apps_df['Revenue'] = apps_df['Installs'] * apps_df['Price']
+
+    # Year of the last update
+    apps_df['Year'] = apps_df['Last Updated'].dt.year
+
+    # Numeric minimum Android version, e.g. '4.0.3 and up' -> 4.0
+    apps_df['Android_Ver_Numeric'] = pd.to_numeric(
+        apps_df['Android Ver'].str.extract(r'(\d+(?:\.\d+)?)', expand=False),
+        errors='coerce'
+    )
+    return apps_df
+
+
+def clean_reviews(reviews_df):
+    return reviews_df.dropna(subset=['Translated_Review'])
@@ -0,0 +1,77 @@
+# <----------Dashboard Creation----------->
+
+# Renders every registered figure to its own HTML file and assembles the
+# plot containers into the index.html dashboard, using the page template,
+# styles and runtime script from assets/.
+
+import html
+import os
+
+import plotly.io as pio
+
+from assets import load_asset
+from figures import FIGURES, plot_width, plot_height
+
+
+# save each plotly figure to an html file. With plotlyjs='inline' every file
+# and container carries its own copy of plotly.js; otherwise plotlyjs is the
+# path of a shared plotly.js file, relative to html_files_path, and the
+# container relies on the dashboard page loading it once.
+def save_plot_as_html(fig, a, b, filename, insight, html_files_path, plotlyjs='inline'):
+    file_path = os.path.join(html_files_path, filename)
+    html_content = pio.to_html(fig, full_html=False, include_plotlyjs='inline' if plotlyjs == 'inline' else False)
+
+    # The plot and its insight, wrapped in a container for the dashboard. The
+    # shared runtime (assets/dashboard.js) handles the data-start/data-end
+    # time window and the click-through to the figure's own file.
+    plot_container = f"""
+    <div class="plot-container" id="{filename}" data-start="{a}" data-end="{b}">
+        <div class="plot">{html_content}</div>
+        <div class="insight">{insight}</div>
+    </div>"""
+
+    fig.write_html(file_path, full_html=False, include_plotlyjs=plotlyjs)
+    return plot_container
+
+
+# Render the given figures (default: all) to their own files and return their
+# dashboard containers, figure number -> markup
+def render_figures(data, html_files_path="./", plotlyjs='inline', numbers=None):
+    # Create directory for HTML files if it doesn't exist
+    if not os.path.exists(html_files_path):
+        os.makedirs(html_files_path)
+
+    plot_containers = {}
+    for number, spec in FIGURES.items():
+        if numbers is not None and number not in numbers:
+            continue
+        fig = spec.build(data)
+        plot_containers[number] = save_plot_as_html(fig, spec.start, spec.end, spec.filename, spec.insight, html_files_path, plotlyjs)
+    return plot_containers
+
+
+# Assemble rendered containers into index.html. live_reload adds the watch
+# mode script that reloads the page when the dashboard is rebuilt.
+def write_dashboard(plot_containers, html_files_path="./", plotlyjs='inline', live_reload=False):
+    # Combine all plot containers and the minified assets into the final HTML
+    final_html = load_asset('dashboard.html').format(
+        plotly_js='' if plotlyjs == 'inline' else f'<script src="{html.escape(plotlyjs)}"></script>',
+        plots=''.join(plot_containers[number] for number in FIGURES if number in plot_containers),
+        plot_width=plot_width,
+        plot_height=plot_height,
+        css=load_asset('dashboard.css'),
+        runtime_js=load_asset('dashboard.js') + (load_asset('live_reload.js') if live_reload else ''),
+    )
+
+    # Write the final HTML to a file, replacing the old one in one step so a
+    # browser reloading the page never reads it half-written
+    dashboard_path = os.path.join(html_files_path, "index.html")
+    partial_path = dashboard_path + '.partial'
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        f.write(final_html)
+    os.replace(partial_path, dashboard_path)
+    return dashboard_path
+
+
+def build_dashboard(data, html_files_path="./", plotlyjs='inline'):
+    return write_dashboard(render_figures(data, html_files_path, plotlyjs), html_files_path, plotlyjs)
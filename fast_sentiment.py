@@ -0,0 +1,262 @@
+# <----------Fast Sentiment Scoring---------->
+
+# Vectorized re-implementation of NLTK's VADER compound score. The lexicon
+# and booster/negation lists are compiled into hashed lookup tables
+# (pd.Index + NumPy arrays), every review is tokenized in bulk and the VADER
+# rules are applied with array operations over all tokens of a batch at once:
+#
+#   - lexicon valence, with the ALL CAPS emphasis when only some words are caps
+#   - boosters/dampeners up to three words back (and their ALL CAPS emphasis)
+#   - negations ("not", "n't", "never so ...") up to three words back
+#   - "least" negation, "kind of" and booster words scoring zero
+#   - the "but" clause shift (0.5x before, 1.5x after) and ! / ? emphasis
+#   - the special-case idioms ("the bomb", "yeah right", ...) and the
+#     "kind of" / "sort of" dampening
+#
+# Only the compound score is produced (not pos/neu/neg). Floating point sums
+# run in a different order than nltk's, so a score can differ in the last
+# rounded digit. `python fast_sentiment.py` prints an accuracy report against
+# nltk on the review corpus.
+
+import re
+import string
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class FastVader:
+
+    def __init__(self, lexicon=None, batch_size=50_000):
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+        self.constants = VaderConstants()
+        if lexicon is None:
+            lexicon = SentimentIntensityAnalyzer().lexicon
+        self.batch_size = batch_size
+
+        # Hashed lookup tables: token -> row, with a trailing default row for misses
+        self.lexicon_index = pd.Index(list(lexicon))
+        self.valences = np.append(np.fromiter(lexicon.values(), dtype=float), 0.0)
+        self.booster_index = pd.Index(list(self.constants.BOOSTER_DICT))
+        self.booster_values = np.append(np.fromiter(self.constants.BOOSTER_DICT.values(), dtype=float), 0.0)
+
+        # Tokens are reduced to their word when they are a word plus one
+        # leading or trailing punctuation mark from VADER's PUNC_LIST
+        punc = '|'.join(re.escape(p) for p in sorted(self.constants.PUNC_LIST, key=len, reverse=True))
+        core = f"[^{re.escape(string.punctuation)}\\s]{{2,}}"
+        self._strip_punc = re.compile(f"^(?:{punc})({core})$|^({core})(?:{punc})$")
+
+    # Per-token features, computed once per distinct token. Row -1 (the
+    # appended last row) stands for "no token", e.g. before the first word.
+    def _token_features(self, tokens):
+        s = pd.Series(tokens, dtype=object)
+        lower = s.str.lower()
+        lex = self.lexicon_index.get_indexer(lower)
+        booster = self.booster_index.get_indexer(lower)
+
+        def column(values, default):
+            return np.append(np.asarray(values), default)
+
+        return {
+            'valence': column(self.valences[lex], 0.0),
+            'in_lexicon': column(lex >= 0, False),
+            'booster': column(self.booster_values[booster], 0.0),
+            'is_booster': column(booster >= 0, False),
+            'upper': column(s.str.isupper().to_numpy(dtype=bool), False),
+            'negated': column((lower.isin(self.constants.NEGATE) | lower.str.contains("n't", regex=False)).to_numpy(dtype=bool), False),
+            'never': column((s == 'never').to_numpy(), False),
+            'so_this': column(s.isin(['so', 'this']).to_numpy(), False),
+            'least': column((lower == 'least').to_numpy(), False),
+            'at_very': column(lower.isin(['at', 'very']).to_numpy(), False),
+            'kind': column((lower == 'kind').to_numpy(), False),
+            'of': column((lower == 'of').to_numpy(), False),
+            'but': column((lower == 'but').to_numpy(), False),
+        }
+
+    # Split reviews into VADER tokens: flat token codes, the review each
+    # token belongs to and the distinct token strings
+    def _tokenize(self, texts):
+        tokens = texts.str.split().explode().dropna()
+        codes, uniques = pd.factorize(tokens.to_numpy())
+        uniques = pd.Series(uniques, dtype=object)
+
+        # Single characters are dropped; lengths are checked per distinct token
+        keep = (uniques.str.len() > 1).to_numpy()[codes]
+        match = uniques.str.extract(self._strip_punc)
+        stripped = match[0].where(match[0].notna(), match[1])
+        stripped = stripped.where(stripped.notna(), uniques)
+        stripped_codes, words = pd.factorize(stripped)
+        return stripped_codes[codes[keep]], tokens.index.to_numpy()[keep], np.asarray(words, dtype=object)
+
+    def _compound_batch(self, texts):
+        n_reviews = len(texts)
+        codes, review, words = self._tokenize(texts)
+        f = self._token_features(words)
+        C_INCR, N_SCALAR = self.constants.C_INCR, self.constants.N_SCALAR
+
+        n = len(codes)
+        counts = np.bincount(review, minlength=n_reviews)
+        starts = np.cumsum(counts) - counts
+        pos = np.arange(n) - starts[review]
+        length = counts[review]
+
+        # nltk looks up the context of a repeated token at its first
+        # occurrence in the review, so do the same
+        first = pd.Series(pos).groupby([review, codes]).transform('min').to_numpy()
+        gi = starts[review] + first
+
+        def before(k):
+            return np.where(first >= k, codes[np.maximum(gi - k, 0)], -1)
+
+        def after(k):
+            return np.where(first + k < length, codes[np.minimum(gi + k, n - 1)], -1)
+
+        n_upper = np.bincount(review, weights=f['upper'][codes], minlength=n_reviews)
+        cap_diff = ((counts - n_upper) > 0) & ((counts - n_upper) < counts)
+        cap = cap_diff[review]
+
+        in_lexicon = f['in_lexicon'][codes]
+        v = f['valence'][codes].copy()
+        v += np.where(in_lexicon & f['upper'][codes] & cap, np.where(v > 0, C_INCR, -C_INCR), 0.0)
+
+        p1, p2, p3 = before(1), before(2), before(3)
+        for start_i, (p, dampen) in enumerate(((p1, 1.0), (p2, 0.95), (p3, 0.9))):
+            active = in_lexicon & (first > start_i) & ~f['in_lexicon'][p]
+
+            # Booster / dampener words before the item
+            s = f['booster'][p] * np.where(v < 0, -1.0, 1.0)
+            s += np.where(f['is_booster'][p] & f['upper'][p] & cap, np.where(v > 0, C_INCR, -C_INCR), 0.0)
+            v = np.where(active, v + s * dampen, v)
+
+            # Negations before the item
+            if start_i == 0:
+                v = np.where(active & f['negated'][p1], v * N_SCALAR, v)
+            elif start_i == 1:
+                never_so = f['never'][p2] & f['so_this'][p1]
+                v = np.where(active & never_so, v * 1.5, v)
+                v = np.where(active & ~never_so & f['negated'][p2], v * N_SCALAR, v)
+            else:
+                never_so = (f['never'][p3] & f['so_this'][p2]) | f['so_this'][p1]
+                v = np.where(active & never_so, v * 1.25, v)
+                v = np.where(active & ~never_so & f['negated'][p3], v * N_SCALAR, v)
+                neighbours = {-3: p3, -2: p2, -1: p1, 0: codes, 1: after(1), 2: after(2)}
+                v = self._idioms_check(v, active, neighbours, pd.Index(words))
+
+        # "least" negation
+        least = in_lexicon & ~f['in_lexicon'][p1] & f['least'][p1]
+        v = np.where(least & (first > 1) & ~f['at_very'][p2], v * N_SCALAR, v)
+        v = np.where(least & (first == 1), v * N_SCALAR, v)
+
+        # Booster words and "kind of" carry no sentiment of their own
+        skip = f['is_booster'][codes] | (f['kind'][codes] & f['of'][after(1)])
+        v = np.where(in_lexicon & ~skip, v, 0.0)
+
+        # "but" clause: halve the words before the first "but", boost the words after
+        but_pos = np.full(n_reviews, np.iinfo(np.int64).max)
+        is_but = f['but'][codes]
+        np.minimum.at(but_pos, review[is_but], pos[is_but])
+        bi = but_pos[review]
+        v = np.where(pos < bi, np.where(bi < np.iinfo(np.int64).max, v * 0.5, v), np.where(pos > bi, v * 1.5, v))
+
+        # Float even when the batch has no scorable tokens (bincount of empty
+        # weights is int64)
+        sum_s = np.bincount(review, weights=v, minlength=n_reviews).astype(float)
+
+        # Emphasis from exclamation points (up to 4) and question marks (2 or more)
+        ep = np.minimum(texts.str.count('!').to_numpy(), 4) * 0.292
+        qm_count = texts.str.count(r'\?').to_numpy()
+        qm = np.where(qm_count > 1, np.where(qm_count <= 3, qm_count * 0.18, 0.96), 0.0)
+        sum_s += np.sign(sum_s) * (ep + qm)
+
+        compound = sum_s / np.sqrt(sum_s * sum_s + 15)
+        return np.round(compound, 4)
+
+    # Idioms around the item replace its valence; "kind of" / "sort of" just
+    # before it dampen it. `neighbours` maps offsets to token code arrays.
+    def _idioms_check(self, v, active, neighbours, word_index):
+        def phrase_match(phrase, offsets):
+            parts = phrase.split(' ')
+            part_codes = word_index.get_indexer(parts)
+            if len(parts) != len(offsets) or (part_codes < 0).any():
+                return None
+            return np.logical_and.reduce([neighbours[o] == c for o, c in zip(offsets, part_codes)])
+
+        idioms = self.constants.SPECIAL_CASE_IDIOMS
+        idiom_value = np.full(len(v), np.nan)
+        # The first matching sequence ending at or before the item wins...
+        for offsets in ((-1, 0), (-2, -1, 0), (-2, -1), (-3, -2, -1), (-3, -2)):
+            for phrase, value in idioms.items():
+                match = phrase_match(phrase, offsets)
+                if match is not None:
+                    idiom_value = np.where(match & np.isnan(idiom_value), value, idiom_value)
+        # ...but sequences starting at the item override it
+        for offsets in ((0, 1), (0, 1, 2)):
+            for phrase, value in idioms.items():
+                match = phrase_match(phrase, offsets)
+                if match is not None:
+                    idiom_value = np.where(match, value, idiom_value)
+        v = np.where(active & ~np.isnan(idiom_value), idiom_value, v)
+
+        bigram = np.zeros(len(v), dtype=bool)
+        for phrase in self.constants.BOOSTER_DICT:
+            for offsets in ((-3, -2), (-2, -1)):
+                match = phrase_match(phrase, offsets)
+                if match is not None:
+                    bigram |= match
+        return np.where(active & bigram, v + self.constants.B_DECR, v)
+
+    # Compound scores for a sequence of review texts, processed in batches
+    def compound(self, texts):
+        texts = pd.Series(texts, copy=False).fillna('').astype(str).reset_index(drop=True)
+        if texts.empty:
+            return np.zeros(0)
+        return np.concatenate([
+            self._compound_batch(texts.iloc[i:i + self.batch_size].reset_index(drop=True))
+            for i in range(0, len(texts), self.batch_size)
+        ])
+
+
+# Compare the fast scorer with nltk's SentimentIntensityAnalyzer on the same
+# texts: agreement, error distribution and timings
+def accuracy_report(texts, fast=None, sia=None):
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    texts = pd.Series(texts, copy=False).fillna('').astype(str).reset_index(drop=True)
+    sia = sia or SentimentIntensityAnalyzer()
+    fast = fast or FastVader()
+
+    start = time.perf_counter()
+    expected = np.array([sia.polarity_scores(text)['compound'] for text in texts])
+    nltk_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = fast.compound(texts)
+    fast_seconds = time.perf_counter() - start
+
+    error = np.abs(actual - expected)
+
+    def label(scores):
+        return np.where(scores >= 0.05, 1, np.where(scores <= -0.05, -1, 0))
+
+    return {
+        'reviews': len(texts),
+        'exact_match': float(np.mean(error < 1e-4)) if len(texts) else 1.0,
+        'label_agreement': float(np.mean(label(actual) == label(expected))) if len(texts) else 1.0,
+        'mean_abs_error': float(error.mean()) if len(texts) else 0.0,
+        'p99_abs_error': float(np.percentile(error, 99)) if len(texts) else 0.0,
+        'max_abs_error': float(error.max()) if len(texts) else 0.0,
+        'nltk_seconds': nltk_seconds,
+        'fast_seconds': fast_seconds,
+        'speedup': nltk_seconds / fast_seconds if fast_seconds else float('inf'),
+    }
+
+
+if __name__ == '__main__':
+    import sys
+
+    reviews_path = sys.argv[1] if len(sys.argv) > 1 else 'User Reviews.csv'
+    reviews_df = pd.read_csv(reviews_path).dropna(subset=['Translated_Review'])
+    for name, value in accuracy_report(reviews_df['Translated_Review']).items():
+        print(f"{name:>16}: {value:.4f}" if isinstance(value, float) else f"{name:>16}: {value}")
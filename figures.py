@@ -0,0 +1,786 @@
+# <----------Plotly Graphs---------->
+
+# One builder per dashboard figure. Each takes the prepared DashboardData
+# (see pipeline.py) plus optional filter parameters and returns the Plotly
+# figure; the @figure decorator registers it in FIGURES together with its
+# display window, output file name, insight and the input datasets it uses.
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from backends import FIG15_CATEGORIES
+from stats import box_figure, histogram_figure
+from timeseries import MAX_POINTS, PERIOD_OFFSETS, RESOLUTIONS, TimeSeriesPyramid, downsample, sample
+
+
+# Common plot settings
+plot_width=400
+plot_height=300
+plot_bg_color='black'
+text_color='white'
+title_font={'size':16}
+axis_font={'size':12}
+
+
+class FigureSpec:
+
+    def __init__(self, number, builder, start, end, filename, insight, params, inputs):
+        self.number = number
+        self.builder = builder
+        self.start = start
+        self.end = end
+        self.filename = filename
+        self.insight = insight
+        # Filter parameters accepted by the builder, name -> parser from string
+        self.params = params or {}
+        # Input datasets the figure is built from, 'apps' and/or 'reviews'
+        self.inputs = frozenset(inputs)
+
+    def build(self, data, **params):
+        return self.builder(data, **params)
+
+
+# Figure number -> FigureSpec, in dashboard order
+FIGURES = {}
+
+
+def figure(number, start, end, filename, insight, params=None, inputs=('apps',)):
+    def register(builder):
+        FIGURES[number] = FigureSpec(number, builder, start, end, filename, insight, params, inputs)
+        return builder
+    return register
+
+
+# Parse a comma-separated query value such as 'GAME,SOCIAL'
+def string_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+# Parse a month number, 1 to 12
+def month_number(value):
+    parsed = int(value)
+    if not 1 <= parsed <= 12:
+        raise ValueError(f"Expected a month from 1 to 12, got {value!r}")
+    return parsed
+
+
+# Parse a time-series resolution: year, month, week, day or auto
+def resolution(value):
+    if value != 'auto' and value not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution {value!r}, expected one of {', '.join(RESOLUTIONS)} or auto")
+    return value
+
+
+# Parse a date window bound such as '2018-01-01' or '2018-01-01T00:00:00Z';
+# time zone aware values are converted to naive UTC like the app dates
+def timestamp(value):
+    parsed = pd.Timestamp(value)
+    if pd.isna(parsed):
+        raise ValueError(f"Invalid date {value!r}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.tz_convert('UTC').tz_localize(None)
+    return parsed
+
+
+# Parse a strictly positive integer such as a number of points
+def positive_int(value):
+    parsed = int(value)
+    if parsed <= 0:
+        raise ValueError(f"Expected a positive integer, got {value!r}")
+    return parsed
+
+
+# Parse the number of points per line trace: LTTB always keeps the first
+# and last points plus at least one in between, so at least 3
+def line_points(value):
+    parsed = int(value)
+    if parsed < 3:
+        raise ValueError(f"Expected at least 3 points per line, got {value!r}")
+    return parsed
+
+
+# Parameters of the time-series figures: level of the pyramid, date window
+# (sent by the explorer page on zoom) and points per trace
+TIME_SERIES_PARAMS = {'resolution': resolution, 'start': timestamp, 'end': timestamp, 'max_points': line_points}
+
+
+# Pyramids of the time-series figures, built once per apps frame
+def updates_pyramid(data):
+    return TimeSeriesPyramid.from_frame(data.apps_df, 'Category', 'Last Updated')
+
+
+def fig14_pyramid(data):
+    df_daily = data.backend.fig14_data(data.apps_df, bucket='day')
+    return TimeSeriesPyramid.from_frame(df_daily, 'Category_Translated', 'Last Updated', ['Installs'])
+
+
+def fig16_pyramid(data):
+    df_daily = data.backend.fig16_data(data.apps_df, bucket='day')
+    return TimeSeriesPyramid.from_frame(df_daily, 'Category_Translated', 'Last Updated', ['Installs'])
+
+
+# Figure 1
+@figure(1, "0", "24", "Category Graph 1.html",
+        "The top categories on the Play Store are dominated by tools, entertainment, and productivity apps")
+def fig1(data):
+    apps_df = data.apps_df
+    backend = data.backend
+    category_counts=backend.category_counts(apps_df, 10)
+    fig1=px.bar(
+        x=category_counts.index,
+        y=category_counts.values,
+        labels={'x':'Category', 'y':'Count'},
+        title='Top Categories on Play Store',
+        color=category_counts.index,
+        color_discrete_sequence=px.colors.sequential.Plasma,
+        width=400,
+        height=300
+    )
+    fig1.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig1
+
+
+# Figure 2
+@figure(2, "0", "24", "Type Graph 2.html",
+        "Most apps on the Playstore are free, indicating a strategy to attract users first and monetize through ads or inapp purchases.")
+def fig2(data):
+    apps_df = data.apps_df
+    backend = data.backend
+    type_counts=backend.type_counts(apps_df)
+    fig2=px.pie(
+        values=type_counts.values,
+        names=type_counts.index,
+        title='App types Distribution',
+        color_discrete_sequence=px.colors.sequential.RdBu,
+        width=400,
+        height=300
+    )
+    fig2.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig2
+
+
+# Figure 3
+@figure(3, "0", "24", "Rating Graph 3.html",
+        "Ratings are skewed towards higher values, sugessting that most apps are favorable by users ")
+def fig3(data):
+    apps_df = data.apps_df
+    fig3=histogram_figure(
+        apps_df['Rating'],
+        x='Rating',
+        nbins=20,
+        title='Rating Distribution',
+        color="#636EFA",
+        width=400,
+        height=300
+    )
+    fig3.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,    
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig3
+
+
+# Figure 4
+@figure(4, "0", "24", "Sentiment Graph 4.html",
+        "Sentiments in reviews show a mix of positive and negative feedback, with a slight lean towards positive sentiments",
+        inputs=('reviews',))
+def fig4(data):
+    reviews_df = data.reviews_df
+    sentiment_counts=reviews_df['Sentiment_Score'].value_counts().rename_axis('Sentiment Score').reset_index(name='Count')
+    # Columns of the frame rather than arrays, which px.bar rejects when
+    # there are no reviews (e.g. a batch segment whose apps have none)
+    fig4=px.bar(
+        sentiment_counts,
+        x='Sentiment Score',
+        y='Count',
+        title='Sentiment Distribution',
+        color='Sentiment Score',
+        color_discrete_sequence=px.colors.sequential.RdPu,
+        width=400,
+        height=300
+    )
+    fig4.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    if sentiment_counts.empty:
+        fig4.add_annotation(text='No reviews', showarrow=False, xref='paper', yref='paper', x=0.5, y=0.5)
+    return fig4
+
+
+# Figure 5
+@figure(5, "0", "24", "Installs Graph 5.html",
+        "The categoris with the most installs are social and communication apps, reflecting their broad appeal and daily usage")
+def fig5(data):
+    apps_df = data.apps_df
+    backend = data.backend
+    install_by_category=backend.installs_by_category(apps_df, 10)
+    fig5=px.bar(
+        x=install_by_category.values,
+        y=install_by_category.index,
+        orientation='h',
+        labels={'x':'Installs', 'y':'Category'},
+        title='Installs by Category',
+        color=install_by_category.index,
+        color_discrete_sequence=px.colors.sequential.Blues,
+        width=400,
+        height=300
+    )
+    fig5.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig5
+
+
+# Figure 6
+@figure(6, "0", "24", "Updates Graph 6.html",
+        "Updades have been increasing over the years, indicating that developers are actively maintaining and improving their apps.",
+        params=TIME_SERIES_PARAMS)
+def fig6(data, resolution='year', start=None, end=None, max_points=MAX_POINTS):
+    pyramid = data.time_series('updates', updates_pyramid)
+    df_updates, resolution = pyramid.level(resolution, start, end, max_points)
+    updates = df_updates.groupby('Last Updated', as_index=False)['Count'].sum()
+    updates = downsample(updates, 'Last Updated', 'Count', max_points=max_points)
+    # Columns of the frame rather than arrays, which px.line rejects when the
+    # date window is empty
+    fig6=px.line(
+        updates,
+        x='Last Updated',
+        y='Count',
+        labels={'Last Updated':resolution.title(), 'Count':'Number of Updates'},
+        title='Number of Updates Over the Years',
+        color_discrete_sequence=['#AB63FE'],
+        width=plot_width,
+        height=plot_height
+    )
+    fig6.update_layout(
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig6
+
+
+# Figure 7
+@figure(7, "0", "24", "Revenue Graph 7.html",
+        "Categories such as Family and Lifestyle lead in revenue generation, indicating their monetization potential.")
+def fig7(data):
+    apps_df = data.apps_df
+    backend = data.backend
+    revenue_by_category=backend.revenue_by_category(apps_df, 10)
+    fig7=px.bar(
+        x=revenue_by_category.index,
+        y=revenue_by_category.values,
+        labels={'x':'Category', 'y':'Revenue'},
+        title='Revenue by Category',
+        color=revenue_by_category.index,
+        color_discrete_sequence=px.colors.sequential.Greens,
+        width=400,
+        height=300
+    )
+    fig7.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig7
+
+
+# Figure 8
+@figure(8, "0", "24", "Genre Graph 8.html",
+        "Action and Entertainment genres are the most common, reflecting users' prefrence for engaging and easy-to-play games.")
+def fig8(data):
+    genre_index = data.genre_index
+    genre_counts=genre_index.counts(10)
+    fig8=px.bar(
+        x=genre_counts.index,
+        y=genre_counts.values,
+        labels={'x':'Genre', 'y':'Count'},
+        title='Top Genres',
+        color=genre_counts.index,
+        color_discrete_sequence=px.colors.sequential.OrRd,
+        width=400,
+        height=300
+    )
+    fig8.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig8
+
+
+# Figure 9
+@figure(9, "0", "24", "Update X Rating Graph 9.html",
+        "The Scatter plot shows a weak correlation between the last update and ratings, suggesting that more frequent updates don't always result in better ratings.",
+        params={'start': timestamp, 'end': timestamp, 'max_points': positive_int})
+def fig9(data, start=None, end=None, max_points=MAX_POINTS):
+    apps_df = data.apps_df
+    in_window = apps_df['Last Updated'].between(start or pd.Timestamp.min, end or pd.Timestamp.max)
+    # At most max_points apps per Type, a uniform sample so the spread of the
+    # ratings is kept
+    df_points = sample(apps_df[in_window].dropna(subset=['Last Updated', 'Rating']), 'Type', max_points)
+    fig9=px.scatter(
+        df_points,
+        x='Last Updated',
+        y='Rating',
+        color='Type',
+        title='Impact of Last Update on Rating',
+        color_discrete_sequence=px.colors.qualitative.Vivid,
+        width=400,
+        height=300
+    )
+    fig9.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig9
+
+
+# Figure 10
+@figure(10, "0", "24", "Paid Free Graph 10.html",
+        "Paid apps generally have higher ratings compared to free apps,suggesting that users expect higher quality from apps they pay for.")
+def fig10(data):
+    apps_df = data.apps_df
+    fig10=box_figure(
+        apps_df,
+        x='Type',
+        y='Rating',
+        title='Rating for Paid vs Free Apps',
+        colors=px.colors.qualitative.Pastel,
+        width=400,
+        height=300
+    )
+    fig10.update_layout(
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(title_font=axis_font),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig10
+
+
+# Figure 11
+@figure(11, "15", "17", "Average Rating vs Total reviews Graph 11.html",
+        "High review counts (popularity) don't always guarantee a perfect average rating, even for top-tier apps.",
+        params={'month': month_number})
+def fig11(data, month=1):
+    apps_df = data.apps_df
+    backend = data.backend
+    chart_data = backend.fig11_data(apps_df, month=month)
+
+    fig11 = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig11.add_trace(
+            go.Bar(
+                x=chart_data['Category'],
+                y=chart_data['Average_Rating'],
+                name='Average Rating',
+                marker_color='rgb(26, 118, 255)',
+                text=chart_data['Average_Rating'].round(2),
+                textposition='auto',
+            ),
+            secondary_y=False,
+        )
+
+    fig11.add_trace(
+            go.Bar(
+                x=chart_data['Category'],
+                y=chart_data['Total_Reviews'],
+                name='Total Reviews',
+                marker_color='rgb(255, 127, 14)',
+                text=chart_data['Total_Reviews'],
+                texttemplate='%{text:.2s}', 
+                textposition='auto',
+            ),
+            secondary_y=True,
+        )
+
+    fig11.update_layout(
+        title='Average Rating vs Total Reviews by Installs',
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font_color='white',
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font),
+        yaxis=dict(
+            title="Average Rating (out of 5)",
+            title_font=axis_font,
+            range=[3.5, 5],
+            gridcolor='gray'
+        ),
+        yaxis2=dict(
+            title="Total Number of Reviews",     
+            title_font=axis_font,
+            overlaying='y',
+            side='right',
+            gridcolor='gray'
+        ),
+        margin=dict(l=10, r=11, t=30, b=10),
+        width=400,
+        height=300,
+        legend=dict(
+            orientation='h',         
+            yanchor='bottom',
+            y=-0.6,
+            xanchor='center',
+            x=0.5
+        )
+    )
+    return fig11
+
+
+# Figure 12
+@figure(12, "18", "20", "Category Choropleth Graph 12.html",
+        "'ENTERTAINMENT' app installs are highly concentrated in a few key countries, while 'EDUCATION' has a much wider global footprint.")
+def fig12(data):
+    apps_df = data.apps_df
+    country_list_iso = [
+        'USA', 'IND', 'CHN', 'BRA', 'RUS', 'GBR', 'DEU', 'FRA', 'JPN', 'CAN', 
+        'AUS', 'MEX', 'IDN', 'PAK', 'NGA', 'BGD', 'EGY', 'VNM', 'TUR', 'IRN',
+        'THA', 'ZAF', 'ITA', 'ESP', 'KOR', 'COL', 'ARG', 'POL', 'UKR', 'SAU'
+    ]
+    apps_df_geo = apps_df.copy()
+    apps_df_geo['Country'] = np.random.choice(country_list_iso, len(apps_df_geo))
+
+    filtered_df = apps_df_geo[~apps_df_geo['Category'].str.startswith(('A', 'C', 'G', 'S'))]
+    top_5_cats_by_installs = filtered_df.groupby('Category')['Installs'].sum().nlargest(5).index
+
+    filtered_df = filtered_df[filtered_df['Category'].isin(top_5_cats_by_installs)]
+
+    map_data = filtered_df.groupby(['Country', 'Category'])['Installs'].sum().reset_index()
+    map_data = map_data[map_data['Installs'] > 1_000_000]
+
+    fig12 = px.choropleth(
+        map_data,
+        locations="Country",           
+        locationmode="ISO-3",        
+        color="Installs",              
+        hover_name="Country",          
+        hover_data={                   
+            "Country": False,
+            "Category": True,
+            "Installs": ':,2s' 
+        },
+        animation_frame="Category",
+        color_continuous_scale=px.colors.sequential.Plasma,
+        scope="world",               
+        title="Global Installs by Category (>1M, Filtered, Random Data)",
+        width=plot_width,
+        height=plot_height
+    )
+
+    fig12.update_layout(
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        margin=dict(l=10, r=10, t=30, b=10),
+        geo=dict(
+            bgcolor='black',
+            lakecolor='black',
+            landcolor='gray',
+            subunitcolor='white'
+        )
+    )
+    fig12.layout.updatemenus = None
+    return fig12
+
+
+# Figure 13
+@figure(13, "13", "14", "Dual Axis Chart Graph 13.html",
+        "'GAME' revenue depends on high installs, but 'PRODUCTIVITY' apps can succeed with a high-price, niche-user model.")
+def fig13(data):
+    apps_df = data.apps_df
+    backend = data.backend
+    grouped_df = backend.fig13_data(apps_df)
+
+    fig13 = make_subplots(specs=[[{"secondary_y": True}]])
+    colors = {
+        'Free': {'Installs': '#1f77b4', 'Revenue': '#d62728'},
+        'Paid': {'Installs': '#aec7e8', 'Revenue': '#ff9896'}
+    }
+    for app_type in ['Free', 'Paid']:
+        data = grouped_df[grouped_df['Type'] == app_type]
+
+        fig13.add_trace(
+            go.Bar(
+                x=data['Category'],
+                y=data['Installs'],
+                name=f'Avg-Inst({app_type[:1]})',
+                marker_color=colors[app_type]['Installs']
+            ),
+            secondary_y=False
+        )
+
+        fig13.add_trace(
+            go.Bar(
+                x=data['Category'],
+                y=data['Revenue'],
+                name=f'Avg-Rev({app_type[:1]})',
+                marker_color=colors[app_type]['Revenue']
+            ),
+            secondary_y=True
+        )
+
+    fig13.update_yaxes(
+        title_text="Average Installs",
+        secondary_y=False,
+        title_font=axis_font,
+        color=text_color,
+        gridcolor='#444'
+    )
+    fig13.update_yaxes(
+        title_text="Average Revenue ($)",
+        secondary_y=True,
+        title_font=axis_font,
+        color=text_color,
+        gridcolor='#444',
+        overlaying='y',
+        side='right'
+    )
+    fig13.update_xaxes(
+        title_font=axis_font,
+        color=text_color
+    )
+    fig13.update_layout(
+        title='Avg Installs vs. Avg Revenue',
+        xaxis_title='Top 3 Categories',
+        barmode='group',
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        width=plot_width,
+        height=plot_height,
+        margin=dict(l=10, r=10, t=30, b=10),
+        legend=dict(
+            orientation='h',         
+            yanchor='bottom',
+            y=-0.6,
+            xanchor='center',
+            x=0.5
+        )
+
+    )
+    return fig13
+
+
+# Figure 14
+@figure(14, "18", "21", "TimeSeries Graph 14.html",
+        "'BUSINESS' app growth is volatile and spiky, whereas 'ENTERTAINMENT' app growth is stable and more predictable.",
+        params={'growth_threshold': float, **TIME_SERIES_PARAMS})
+def fig14(data, growth_threshold=0.20, resolution='month', start=None, end=None, max_points=MAX_POINTS):
+    pyramid = data.time_series('fig14', fig14_pyramid)
+    df_agg, resolution = pyramid.level(resolution, start, end, max_points)
+    df_agg['Significant_Growth'] = df_agg['Installs_Growth_Pct'] > growth_threshold
+    # Growth periods are taken before thinning, so none is dropped with it
+    growth_periods = df_agg[df_agg['Significant_Growth'] == True]
+    df_agg = downsample(df_agg, 'Last Updated', 'Installs', 'Category_Translated', max_points)
+
+    fig14 = px.line(
+        df_agg, 
+        x='Last Updated', 
+        y='Installs', 
+        color='Category_Translated', 
+        title='Monthly Installs Trend',
+        labels={'Category_Translated': 'Category', 'Last Updated': resolution.title(), 'Installs': 'Total Installs'},
+        width=plot_width,
+        height=plot_height
+    )
+
+    shapes_list = []
+
+    for index, row in growth_periods.iterrows():
+        start_date = row['Last Updated']
+        # The growth period lasts one period of the shown resolution
+        end_date = start_date + PERIOD_OFFSETS[resolution]
+        shapes_list.append(
+            go.layout.Shape(
+                type="rect", 
+                xref="x",
+                yref="paper", 
+                x0=start_date,
+                y0=0,
+                x1=end_date,
+                y1=1, 
+                fillcolor="lightgreen",
+                opacity=0.2,
+                layer="below",
+                line_width=0, 
+            )
+        )
+
+    fig14.update_layout(
+        shapes=shapes_list,
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font,gridcolor='#444'),
+        yaxis=dict(title_font=axis_font,gridcolor='#444'),
+        legend=dict(font=dict(size=10)),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig14
+
+
+# Figure 15
+@figure(15, "17", "19", "Bubble Chart Graph 15.html",
+        "For popular apps, users clearly do not care about large file sizes as long as the quality (rating) is high.",
+        params={'categories': string_list}, inputs=('apps', 'reviews'))
+def fig15(data, categories=FIG15_CATEGORIES):
+    apps_df = data.apps_df
+    reviews_df = data.reviews_df
+    backend = data.backend
+    df_filtered_15 = backend.fig15_data(apps_df, reviews_df, categories)
+
+    unique_categories = df_filtered_15['Category_Translated'].unique()
+    color_map_15 = {}
+    for cat in unique_categories:
+        if cat == 'GAME': 
+            color_map_15[cat] = 'pink'
+
+    fig15 = px.scatter(
+        df_filtered_15,
+        x='Size',
+        y='Rating',
+        size='Installs',
+        color='Category_Translated',
+        color_discrete_map=color_map_15,
+        hover_name='App',
+        hover_data=['Category', 'Installs', 'Size', 'Rating', 'Sentiment_Subjectivity'],
+        title='App Size vs. Rating',
+        labels={
+            'Size': 'Size (MB)', 
+            'Rating': 'Average Rating', 
+            'Category_Translated': 'Category',
+            'Installs': 'Total Installs'
+        },
+        size_max=50,
+        width=plot_width,
+        height=plot_height
+    )
+
+    fig15.update_layout(
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font, gridcolor='#444'),
+        yaxis=dict(title_font=axis_font, gridcolor='#444'),
+        legend=dict(font=dict(size=9)),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig15
+
+
+# Figure 16
+@figure(16, "16", "18", "Stacked Area Graph 16.html",
+        "'PHOTOGRAPHY' is the established market leader in installs, but 'PRODUCTIVITY' is the high-velocity challenger closing the gap.",
+        params={'growth_threshold': float, **TIME_SERIES_PARAMS})
+def fig16(data, growth_threshold=0.25, resolution='month', start=None, end=None, max_points=MAX_POINTS):
+    pyramid = data.time_series('fig16', fig16_pyramid)
+    df_cumulative_16, resolution = pyramid.level(resolution, start, end, max_points)
+    high_growth_months = df_cumulative_16[df_cumulative_16['Installs_Growth_Pct'] > growth_threshold]['Last Updated'].unique()
+    df_cumulative_16 = downsample(df_cumulative_16, 'Last Updated', 'Cumulative_Installs', 'Category_Translated', max_points)
+
+    fig16 = px.area(
+        df_cumulative_16,
+        x='Last Updated',
+        y='Cumulative_Installs',
+        color='Category_Translated',
+        title='Cumulative Installs Over Time',
+        labels={
+            'Last Updated': resolution.title(),
+            'Cumulative_Installs': 'Cumulative Installs',
+            'Category_Translated': 'Category'
+        },
+        width=plot_width,
+        height=plot_height
+    )
+
+    shapes_list_16 = []
+    for month_start in high_growth_months:
+        month_end = month_start + PERIOD_OFFSETS[resolution]
+        shapes_list_16.append(
+            go.layout.Shape(
+                type="rect",
+                xref="x",
+                yref="paper",
+                x0=month_start,
+                y0=0,
+                x1=month_end,
+                y1=1,
+                fillcolor="yellow",
+                opacity=0.3,
+                layer="below",
+                line_width=0,
+            )
+        )
+
+    fig16.update_layout(
+        shapes=shapes_list_16,
+        plot_bgcolor=plot_bg_color,
+        paper_bgcolor=plot_bg_color,
+        font_color=text_color,
+        title_font=title_font,
+        xaxis=dict(title_font=axis_font, gridcolor='#444'),
+        yaxis=dict(title_font=axis_font, gridcolor='#444'),
+        legend=dict(font=dict(size=9)),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig16
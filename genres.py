@@ -0,0 +1,73 @@
+# <----------Genre Index---------->
+
+# Sparse app x genre incidence built once from the ';'-separated 'Genres'
+# column, stored CSR-style: the genre codes of app i are
+# indices[indptr[i]:indptr[i + 1]]. Genre strings are split once per distinct
+# value and the result is broadcast to the rows, so nothing wider than one
+# code per (app, genre) pair is ever materialized.
+
+import numpy as np
+import pandas as pd
+
+
+class GenreIndex:
+
+    def __init__(self, genres, indptr, indices, index):
+        self.genres = genres
+        self.indptr = indptr
+        self.indices = indices
+        self.index = index
+        # Row position of every stored (app, genre) pair
+        self.rows = np.repeat(np.arange(len(index)), np.diff(indptr))
+
+    @classmethod
+    def from_series(cls, series, sep=';'):
+        codes, uniques = pd.factorize(series)
+
+        # Split each distinct genre string once
+        split = [value.split(sep) for value in uniques]
+        genres, unique_indices = np.unique(
+            np.array([g for parts in split for g in parts], dtype=object), return_inverse=True
+        )
+        unique_lengths = np.array([len(parts) for parts in split], dtype=np.int64)
+        unique_starts = np.cumsum(unique_lengths) - unique_lengths
+
+        # Broadcast to rows; code -1 (missing) picks the appended zero length
+        lengths = np.append(unique_lengths, 0)[codes]
+        starts = np.append(unique_starts, 0)[codes]
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        offsets = np.arange(indptr[-1]) - np.repeat(indptr[:-1], lengths)
+        indices = unique_indices[np.repeat(starts, lengths) + offsets]
+
+        return cls(pd.Index(genres, name='Genre'), indptr, indices.astype(np.int32), series.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    # Number of apps listing each genre, most common first
+    def counts(self, n=None):
+        counts = pd.Series(
+            np.bincount(self.indices, minlength=len(self.genres)), index=self.genres, name='count'
+        )
+        counts = counts.sort_values(ascending=False, kind='stable')
+        return counts.head(n) if n is not None else counts
+
+    # Genre x category counts for the given per-app category labels
+    def by_category(self, categories):
+        category_codes, category_names = pd.factorize(pd.Series(categories, index=self.index), sort=True)
+        pair_codes = category_codes[self.rows]
+        valid = pair_codes >= 0
+        flat = self.indices[valid].astype(np.int64) * len(category_names) + pair_codes[valid]
+        table = np.bincount(flat, minlength=len(self.genres) * len(category_names))
+        return pd.DataFrame(
+            table.reshape(len(self.genres), len(category_names)),
+            index=self.genres,
+            columns=pd.Index(category_names, name='Category'),
+        )
+
+    # Boolean mask of the apps listing any of the given genres
+    def mask(self, *genres):
+        codes = self.genres.get_indexer(genres)
+        mask = np.zeros(len(self.index), dtype=bool)
+        mask[self.rows[np.isin(self.indices, codes[codes >= 0])]] = True
+        return mask
@@ -0,0 +1,74 @@
+# <----------Data Pipeline---------->
+
+# Everything the figures need, prepared once: loaded and cleaned frames,
+# review sentiment scores, the genre index and the execution backend.
+
+import os
+
+import nltk
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from backends import get_backend
+from cleaning import load_data, clean_apps, clean_reviews
+from fast_sentiment import FastVader
+from genres import GenreIndex
+
+
+class DashboardData:
+
+    def __init__(self, apps_df, reviews_df, backend, genre_index):
+        self.apps_df = apps_df
+        self.reviews_df = reviews_df
+        self.backend = backend
+        self.genre_index = genre_index
+        self._time_series = {}
+
+    # Time-series pyramid `name` (see timeseries.py), built by build(data) on
+    # first use and kept until apps_df is replaced
+    def time_series(self, name, build):
+        cached = self._time_series.get(name)
+        if cached is None or cached[0] is not self.apps_df:
+            cached = self._time_series[name] = (self.apps_df, build(self))
+        return cached[1]
+
+
+SENTIMENT_SCORERS = ('nltk', 'fast')
+
+
+# Sentiment Analysis on user reviews. The 'fast' scorer computes the same
+# VADER compound score in batches (see fast_sentiment.py).
+def score_sentiment(reviews_df, scorer=None):
+    scorer = scorer or os.environ.get('DASHBOARD_SENTIMENT', 'nltk')
+    if scorer not in SENTIMENT_SCORERS:
+        raise ValueError(f"Unknown sentiment scorer {scorer!r}, expected one of {SENTIMENT_SCORERS}")
+
+    nltk.download('vader_lexicon')
+    if scorer == 'fast':
+        reviews_df['Sentiment_Score'] = FastVader().compound(reviews_df['Translated_Review'])
+        return reviews_df
+
+    sia = SentimentIntensityAnalyzer()
+    # Calculate sentiment scores for each review
+    reviews_df['Sentiment_Score'] = reviews_df['Translated_Review'].apply(lambda x: sia.polarity_scores(x)['compound'])
+    return reviews_df
+
+
+def prepare_data(apps_path='Play Store Data.csv', reviews_path='User Reviews.csv', backend=None, verbose=False,
+                 quarantine_path='quarantine.csv'):
+    backend = backend or get_backend()
+
+    apps_df, reviews_df = load_data(apps_path, reviews_path, backend)
+    if verbose:
+        print(apps_df.head())
+        print(reviews_df.head())
+
+    # Handling missing values and duplicates, validation (malformed rows go to
+    # quarantine_path), type conversions and derived columns
+    apps_df = clean_apps(apps_df, quarantine_path)
+    reviews_df = clean_reviews(reviews_df)
+
+    # Sparse app x genre index for the multi-label 'Genres' column
+    genre_index = GenreIndex.from_series(apps_df['Genres'])
+
+    reviews_df = score_sentiment(reviews_df)
+    return DashboardData(apps_df, reviews_df, backend, genre_index)
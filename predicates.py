@@ -0,0 +1,97 @@
+# <----------Predicate Index---------->
+
+# Cached boolean masks over a DataFrame. Each named predicate (column, test
+# and arguments) is evaluated once and kept as a numpy bool array; figures
+# then build their selections by combining masks with &, | and ~.
+#
+# String predicates are evaluated against the unique values of the column
+# only and broadcast back to the rows through the factorized codes, so
+# `App.str.contains('s')` runs once per distinct app name instead of once per
+# row per figure.
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+
+OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+class PredicateIndex:
+
+    def __init__(self, df):
+        self.df = df
+        self._masks = {}
+        self._factorized = {}
+
+    def __len__(self):
+        return len(self._masks)
+
+    def _cached(self, key, compute):
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.asarray(compute(), dtype=bool)
+            mask.flags.writeable = False
+            self._masks[key] = mask
+        return mask
+
+    # Evaluate a Series -> bool Series function on the unique values of a
+    # column and broadcast the result to every row. Missing values are False.
+    def _on_uniques(self, column, func):
+        if column not in self._factorized:
+            self._factorized[column] = pd.factorize(self.df[column])
+        codes, uniques = self._factorized[column]
+        result = func(pd.Series(uniques)).to_numpy(dtype=bool, na_value=False)
+        return np.append(result, False)[codes]
+
+    def compare(self, column, op, value):
+        return self._cached(
+            ('compare', column, op, value),
+            lambda: OPERATORS[op](self.df[column].to_numpy(), value)
+        )
+
+    def between(self, column, low, high):
+        return self.compare(column, '>=', low) & self.compare(column, '<=', high)
+
+    def notna(self, column):
+        return self._cached(('notna', column), lambda: self.df[column].notna())
+
+    def isin(self, column, values):
+        values = tuple(values)
+        return self._cached(
+            ('isin', column, values),
+            lambda: self._on_uniques(column, lambda s: s.isin(values))
+        )
+
+    def startswith(self, column, prefixes):
+        prefixes = tuple(prefixes)
+        return self._cached(
+            ('startswith', column, prefixes),
+            lambda: self._on_uniques(column, lambda s: s.str.startswith(prefixes))
+        )
+
+    def contains(self, column, pattern, case=True, regex=True):
+        return self._cached(
+            ('contains', column, pattern, case, regex),
+            lambda: self._on_uniques(column, lambda s: s.str.contains(pattern, case=case, regex=regex))
+        )
+
+    def str_len(self, column, op, value):
+        return self._cached(
+            ('str_len', column, op, value),
+            lambda: self._on_uniques(column, lambda s: OPERATORS[op](s.str.len(), value))
+        )
+
+    def month(self, column, month):
+        return self._cached(
+            ('month', column, month),
+            lambda: self._on_uniques(column, lambda s: s.dt.month == month)
+        )
@@ -0,0 +1,258 @@
+# <----------Local Dashboard Server---------->
+
+# Serves the dashboard figures over HTTP so that filter variants can be
+# explored without rebuilding everything. The data is loaded, cleaned and
+# scored once at start-up; each figure is then rendered on demand:
+#
+#   GET /                         small explorer page
+#   GET /api/figures              figure list with their filter parameters
+#   GET /api/figures/11?month=3   figure JSON (Plotly.react-ready)
+#   GET /api/figures/14?resolution=auto&start=2017-01-01&end=2017-06-30
+#                                 time-series figure at the finest resolution
+#                                 fitting the window (fetched on zoom)
+#   GET /plotly.js                plotly.js bundled with the plotly package
+#
+# Rendered figures are kept in an LRU cache keyed on the normalized
+# parameters, and every response carries an ETag so unchanged figures are
+# answered with 304 Not Modified.
+#
+#   python server.py --port 8050 --backend duckdb
+
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from plotly.offline import get_plotlyjs
+
+from backends import get_backend
+from figures import FIGURES
+from pipeline import prepare_data
+
+
+# Errors answered with a 404 (unknown route or figure) or a 400 (invalid
+# query parameters); anything else raised while rendering is a 500
+class NotFound(LookupError):
+    pass
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class FigureAPI:
+
+    def __init__(self, data, cache_size=128):
+        self.data = data
+        # Backends keep per-frame caches, so figures are built one at a time
+        self._lock = threading.Lock()
+        self.render = functools.lru_cache(maxsize=cache_size)(self._render)
+
+    # Turn raw query parameters into a hashable, canonical cache key: values
+    # are parsed, defaults are filled in and list values are sorted, so
+    # '?categories=GAME,SOCIAL' and '?categories=SOCIAL,GAME' share an entry
+    def normalize(self, number, query):
+        spec = FIGURES[number]
+        unknown = set(query) - set(spec.params)
+        if unknown:
+            raise BadRequest(f"Unknown parameter(s) for figure {number}: {', '.join(sorted(unknown))}")
+
+        defaults = inspect.signature(spec.builder).parameters
+        params = {}
+        for name, parser in spec.params.items():
+            if name in query:
+                try:
+                    value = parser(query[name][-1])
+                except (TypeError, ValueError) as exc:
+                    raise BadRequest(f"Invalid value for {name}: {exc}") from exc
+            else:
+                value = defaults[name].default
+            if isinstance(value, (list, tuple)):
+                value = tuple(sorted(value))
+            params[name] = value
+        return tuple(sorted(params.items()))
+
+    def _render(self, number, key):
+        params = {name: list(value) if isinstance(value, tuple) else value for name, value in key}
+        with self._lock:
+            fig = FIGURES[number].build(self.data, **params)
+        return _with_etag(fig.to_json().encode('utf-8'))
+
+    def figure_json(self, number, query):
+        return self.render(number, self.normalize(number, query))
+
+    @functools.cached_property
+    def index_json(self):
+        figures = []
+        for number, spec in FIGURES.items():
+            defaults = inspect.signature(spec.builder).parameters
+            figures.append({
+                'number': number,
+                'filename': spec.filename,
+                'insight': spec.insight,
+                'params': {name: defaults[name].default for name in spec.params},
+            })
+        return _with_etag(json.dumps({'figures': figures}).encode('utf-8'))
+
+    @functools.cached_property
+    def plotly_js(self):
+        return _with_etag(get_plotlyjs().encode('utf-8'))
+
+
+def _with_etag(body):
+    return body, '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+EXPLORER_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>Google Play Store Review Analysis - Explorer</title>
+<script src="/plotly.js"></script>
+<style>
+    body { font-family: Arial, sans-serif; background-color: #333; color: #fff; margin: 20px; }
+    select, input, button { margin-right: 10px; }
+    #plot { margin-top: 20px; }
+</style>
+</head>
+<body>
+    <h1>Google Play Store Review Analysis</h1>
+    <select id="figure"></select>
+    <input id="params" size="60" placeholder="month=3">
+    <button onclick="load()">Show</button>
+    <div id="plot"></div>
+<script>
+    // Figures that accept a date window are re-fetched on zoom, at the finest
+    // resolution that fits the zoomed range when they have one
+    var zoomable = {};
+    fetch('/api/figures').then(r => r.json()).then(index => {
+        var select = document.getElementById('figure');
+        index.figures.forEach(f => {
+            if ('start' in f.params) {
+                zoomable[f.number] = 'resolution' in f.params ? ['resolution=auto'] : [];
+            }
+            var option = document.createElement('option');
+            option.value = f.number;
+            option.text = f.filename + (Object.keys(f.params).length ? ' (' + Object.keys(f.params).join(', ') + ')' : '');
+            select.add(option);
+        });
+        load();
+    });
+    function load(extra) {
+        var number = document.getElementById('figure').value;
+        var params = [document.getElementById('params').value].concat(extra || []).filter(p => p).join('&');
+        fetch('/api/figures/' + number + (params ? '?' + params : ''))
+            .then(r => r.ok ? r.json() : r.text().then(t => { throw new Error(t); }))
+            .then(fig => Plotly.react('plot', fig.data, fig.layout))
+            .then(plot => {
+                if (!plot.zoomHandler) {
+                    plot.zoomHandler = true;
+                    plot.on('plotly_relayout', zoom);
+                }
+            })
+            .catch(err => { document.getElementById('plot').innerText = err.message; });
+    }
+    function zoom(event) {
+        var extra = zoomable[document.getElementById('figure').value];
+        if (!extra) {
+            return;
+        }
+        if (event['xaxis.autorange']) {
+            load();
+        } else if (event['xaxis.range[0]'] !== undefined) {
+            load(extra.concat([
+                'start=' + encodeURIComponent(event['xaxis.range[0]']),
+                'end=' + encodeURIComponent(event['xaxis.range[1]'])
+            ]));
+        }
+    }
+</script>
+</body>
+</html>
+"""
+
+
+def make_handler(api):
+
+    class DashboardHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = [part for part in url.path.split('/') if part]
+            try:
+                if not parts:
+                    self._send(_with_etag(EXPLORER_HTML.encode('utf-8')), 'text/html; charset=utf-8')
+                elif parts == ['plotly.js']:
+                    self._send(api.plotly_js, 'application/javascript')
+                elif parts == ['api', 'figures']:
+                    self._send(api.index_json, 'application/json')
+                elif len(parts) == 3 and parts[:2] == ['api', 'figures']:
+                    number = int(parts[2]) if parts[2].isdigit() else None
+                    if number not in FIGURES:
+                        raise NotFound(f"No figure {parts[2]}")
+                    self._send(api.figure_json(number, parse_qs(url.query, keep_blank_values=True)), 'application/json')
+                else:
+                    raise NotFound(f"No route for {url.path}")
+            except NotFound as exc:
+                self._error(404, str(exc))
+            except BadRequest as exc:
+                self._error(400, str(exc))
+            except Exception as exc:
+                traceback.print_exc()
+                self._error(500, f"{type(exc).__name__}: {exc}")
+
+        def _send(self, response, content_type):
+            body, etag = response
+            if etag in self.headers.get('If-None-Match', ''):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _error(self, status, message):
+            body = json.dumps({'error': message}).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return DashboardHandler
+
+
+def serve(data, host='127.0.0.1', port=8050, cache_size=128):
+    api = FigureAPI(data, cache_size)
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    print(f"Serving dashboard figures on http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve the Play Store dashboard figures locally.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--backend', default=None, help='pandas, duckdb or polars (default: DASHBOARD_BACKEND or pandas)')
+    parser.add_argument('--apps', default='Play Store Data.csv')
+    parser.add_argument('--reviews', default='User Reviews.csv')
+    parser.add_argument('--cache-size', type=int, default=128)
+    args = parser.parse_args()
+
+    data = prepare_data(args.apps, args.reviews, get_backend(args.backend))
+    serve(data, args.host, args.port, args.cache_size)
@@ -0,0 +1,200 @@
+# <----------Snapshot Store---------->
+
+# Append-only history of cleaned Play Store exports, stored as Parquet
+# partitioned by snapshot date and category:
+#
+#   snapshots/apps/snapshot_date=2026-10-19/Category=GAME/<part>.parquet
+#   snapshots/deltas/snapshot_date=2026-10-19/Category=GAME/<part>.parquet
+#
+# Reads only open the partitions a query asks for. When a snapshot is
+# ingested, per-app install deltas against the previous snapshot are computed
+# from that one snapshot and stored alongside, so growth over time never
+# requires re-reading the whole history.
+#
+#   python snapshots.py ingest "Play Store Data.csv" --date 2026-10-19
+#   python snapshots.py deltas --categories GAME,SOCIAL
+
+import argparse
+import datetime
+import os
+import shutil
+import uuid
+from urllib.parse import unquote
+
+import pandas as pd
+
+
+# An app is identified by its name and category; the export lists some apps
+# under more than one category
+APP_KEY = ['App', 'Category']
+
+
+class SnapshotStore:
+
+    def __init__(self, root='snapshots'):
+        self.root = root
+
+    def _table_dir(self, table):
+        return os.path.join(self.root, table)
+
+    def _partition_dir(self, table, snapshot_date):
+        return os.path.join(self._table_dir(table), f"snapshot_date={snapshot_date}")
+
+    # Category value -> partition directory (values are URI-encoded on disk)
+    def _category_dirs(self, table, snapshot_date):
+        path = self._partition_dir(table, snapshot_date)
+        return {
+            unquote(name.split('=', 1)[1]): os.path.join(path, name)
+            for name in sorted(os.listdir(path)) if name.startswith('Category=')
+        }
+
+    def _partition_dates(self, table):
+        table_dir = self._table_dir(table)
+        if not os.path.isdir(table_dir):
+            return []
+        return sorted(
+            name.split('=', 1)[1] for name in os.listdir(table_dir) if name.startswith('snapshot_date=')
+        )
+
+    # The apps partition is the commit point of a snapshot: deltas of a date
+    # whose ingest did not complete are not listed
+    def snapshot_dates(self, table='apps'):
+        dates = self._partition_dates('apps')
+        if table != 'apps':
+            dates = sorted(set(dates) & set(self._partition_dates(table)))
+        return dates
+
+    def categories(self, snapshot_date, table='apps'):
+        return sorted(self._category_dirs(table, _normalize_date(snapshot_date)))
+
+    # Add a cleaned export as a new snapshot and store its install deltas
+    # against the previous snapshot. Snapshots must arrive in date order and
+    # existing partitions are never rewritten, so an empty export is
+    # rejected: the next snapshot would report every app as new.
+    def ingest(self, apps_df, snapshot_date):
+        snapshot_date = _normalize_date(snapshot_date)
+        if apps_df.empty:
+            raise ValueError(f"Snapshot {snapshot_date} has no apps")
+        dates = self.snapshot_dates()
+        if snapshot_date in dates:
+            raise FileExistsError(f"Snapshot {snapshot_date} is already in the store")
+        if dates and snapshot_date < dates[-1]:
+            raise ValueError(f"Snapshot {snapshot_date} is older than the latest snapshot {dates[-1]}")
+
+        # Only the latest snapshot is read to compute the deltas
+        deltas = None
+        if dates:
+            previous = self.read(snapshot_dates=[dates[-1]], columns=APP_KEY + ['Installs'])
+            deltas = _install_deltas(previous, apps_df, dates[-1], snapshot_date)
+
+        # Both tables are written to scratch directories before either is
+        # published, and the apps partition is moved into place last: if
+        # anything fails, the snapshot is absent and can be ingested again
+        tables = [('deltas', deltas), ('apps', apps_df)] if deltas is not None else [('apps', apps_df)]
+        scratches = []
+        try:
+            for table, df in tables:
+                scratches.append((table, self._stage(df)))
+            # Left over by an earlier ingest of this date that did not complete
+            shutil.rmtree(self._partition_dir('deltas', snapshot_date), ignore_errors=True)
+            for table, scratch in scratches:
+                os.makedirs(self._table_dir(table), exist_ok=True)
+                os.rename(scratch, self._partition_dir(table, snapshot_date))
+        finally:
+            for table, scratch in scratches:
+                shutil.rmtree(scratch, ignore_errors=True)
+        return snapshot_date
+
+    # Write one table to a scratch directory, so a failed write never leaves
+    # a partial partition behind
+    def _stage(self, df):
+        scratch = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        try:
+            df.to_parquet(scratch, partition_cols=['Category'], index=False)
+        except BaseException:
+            shutil.rmtree(scratch, ignore_errors=True)
+            raise
+        return scratch
+
+    # Read the requested snapshots and categories, opening only their partitions
+    def read(self, snapshot_dates=None, categories=None, columns=None, table='apps'):
+        available = self.snapshot_dates(table)
+        dates = available if snapshot_dates is None else [_normalize_date(d) for d in snapshot_dates]
+        missing = set(dates) - set(available)
+        if missing:
+            raise KeyError(f"No {table} snapshot(s) for {', '.join(sorted(missing))}")
+
+        file_columns = None if columns is None else [c for c in columns if c not in ('Category', 'snapshot_date')]
+        frames = []
+        for snapshot_date in dates:
+            category_dirs = self._category_dirs(table, snapshot_date)
+            if categories is not None:
+                category_dirs = {c: path for c, path in category_dirs.items() if c in set(categories)}
+            for category, path in category_dirs.items():
+                df = pd.read_parquet(path, columns=file_columns)
+                df['Category'] = category
+                df['snapshot_date'] = pd.Timestamp(snapshot_date)
+                frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames, ignore_index=True)
+        return df[columns] if columns is not None else df
+
+    def deltas(self, snapshot_dates=None, categories=None, columns=None):
+        return self.read(snapshot_dates, categories, columns, table='deltas')
+
+
+def _normalize_date(value):
+    return pd.Timestamp(value).date().isoformat()
+
+
+# Per-app change in installs between two snapshots. Apps that are new in the
+# later snapshot count from zero; apps that disappeared are not reported.
+def _install_deltas(previous, current, previous_date, snapshot_date):
+    previous = previous.groupby(APP_KEY, as_index=False)['Installs'].max()
+    current = current.groupby(APP_KEY, as_index=False)['Installs'].max()
+    deltas = current.merge(previous, on=APP_KEY, how='left', suffixes=('', '_Previous'))
+    deltas['New_App'] = deltas['Installs_Previous'].isna()
+    deltas['Installs_Previous'] = deltas['Installs_Previous'].fillna(0).astype(deltas['Installs'].dtype)
+    deltas['Install_Delta'] = deltas['Installs'] - deltas['Installs_Previous']
+    deltas['Previous_Snapshot'] = pd.Timestamp(previous_date)
+    deltas['Days'] = (pd.Timestamp(snapshot_date) - pd.Timestamp(previous_date)).days
+    return deltas
+
+
+if __name__ == '__main__':
+    from backends import get_backend
+    from cleaning import clean_apps
+
+    parser = argparse.ArgumentParser(description='Partitioned history of Play Store snapshots.')
+    parser.add_argument('--store', default='snapshots', help='store directory (default: snapshots)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='clean an export and append it as a snapshot')
+    ingest.add_argument('path', help='Play Store export (CSV or Parquet)')
+    ingest.add_argument('--date', default=datetime.date.today().isoformat(), help='snapshot date (default: today)')
+    ingest.add_argument('--backend', default=None)
+    ingest.add_argument('--quarantine', default=None, help='CSV file for rows failing validation')
+
+    commands.add_parser('list', help='list the stored snapshots')
+
+    deltas = commands.add_parser('deltas', help='print per-app install deltas')
+    deltas.add_argument('--dates', default=None, help='comma-separated snapshot dates (default: all)')
+    deltas.add_argument('--categories', default=None, help='comma-separated categories (default: all)')
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.store)
+
+    if args.command == 'ingest':
+        backend = get_backend(args.backend)
+        apps_df = clean_apps(backend.read_apps(args.path), args.quarantine)
+        print(f"Ingested snapshot {store.ingest(apps_df, args.date)} ({len(apps_df)} apps)")
+    elif args.command == 'list':
+        for snapshot_date in store.snapshot_dates():
+            print(snapshot_date, len(store.categories(snapshot_date)), 'categories')
+    else:
+        print(store.deltas(
+            snapshot_dates=args.dates.split(',') if args.dates else None,
+            categories=args.categories.split(',') if args.categories else None,
+        ).sort_values('Install_Delta', ascending=False).to_string(index=False))
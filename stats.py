@@ -0,0 +1,120 @@
+# <----------Precomputed Summary Statistics---------->
+
+# Box plot and histogram figures built from statistics computed in NumPy.
+# px.box / px.histogram embed every row in the HTML and let the browser work
+# out quartiles and bins; these figures only ship the summary, so their size
+# does not grow with the number of apps.
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+# Upper bound on the outlier points drawn per box
+MAX_BOX_OUTLIERS = 50
+
+
+def _finite(values):
+    values = np.asarray(values, dtype=float)
+    return values[np.isfinite(values)]
+
+
+# Quartiles, whiskers (1.5 IQR, clipped to the data as Plotly does) and the
+# distinct outlier values with their counts, keeping the most extreme ones
+def box_stats(values, max_outliers=MAX_BOX_OUTLIERS):
+    values = _finite(values)
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    low_limit, high_limit = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    inside = values[(values >= low_limit) & (values <= high_limit)]
+
+    outliers, outlier_counts = np.unique(
+        values[(values < low_limit) | (values > high_limit)], return_counts=True
+    )
+    if len(outliers) > max_outliers:
+        keep = np.sort(np.argsort(-np.abs(outliers - median), kind='stable')[:max_outliers])
+        outliers, outlier_counts = outliers[keep], outlier_counts[keep]
+
+    return {
+        'count': len(values),
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': inside.min(),
+        'upperfence': inside.max(),
+        'outliers': outliers,
+        'outlier_counts': outlier_counts,
+    }
+
+
+# Equal-width bin edges and counts over the data range. Values are assigned
+# with a small tolerance: discrete data such as ratings sits exactly on the
+# edges, and (4.8 - 1) / 0.2 = 18.999... would otherwise put 4.8 in the bin
+# below. The maximum goes into the last bin, as with np.histogram.
+def histogram_counts(values, nbins=20):
+    values = _finite(values)
+    edges = np.histogram_bin_edges(values, bins=nbins)
+    width = edges[1] - edges[0]
+    index = np.floor((values - edges[0]) / width + 1e-9).astype(np.int64)
+    counts = np.bincount(np.clip(index, 0, nbins - 1), minlength=nbins)
+    return counts, edges
+
+
+# One precomputed box per group, plus its outliers as a marker trace
+def box_figure(df, x, y, colors, **layout):
+    fig = go.Figure()
+    groups = df[x].dropna().unique()
+    for i, group in enumerate(groups):
+        stats = box_stats(df.loc[df[x] == group, y])
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(
+            x=[group],
+            q1=[stats['q1']],
+            median=[stats['median']],
+            q3=[stats['q3']],
+            lowerfence=[stats['lowerfence']],
+            upperfence=[stats['upperfence']],
+            name=str(group),
+            legendgroup=str(group),
+            marker_color=color,
+            boxpoints=False,
+        ))
+        if len(stats['outliers']):
+            fig.add_trace(go.Scatter(
+                x=[group] * len(stats['outliers']),
+                y=stats['outliers'],
+                customdata=stats['outlier_counts'],
+                mode='markers',
+                name=str(group),
+                legendgroup=str(group),
+                showlegend=False,
+                marker_color=color,
+                hovertemplate=f'{y}=%{{y}}<br>apps=%{{customdata}}<extra>{group}</extra>',
+            ))
+    fig.update_layout(
+        xaxis_title=x,
+        yaxis_title=y,
+        boxmode='overlay',
+        legend_title_text=x,
+        **layout
+    )
+    return fig
+
+
+# Histogram as a bar trace of precomputed bin counts
+def histogram_figure(values, x, nbins, color, **layout):
+    counts, edges = histogram_counts(values, nbins)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        marker_color=color,
+        hovertemplate=f'{x}=%{{customdata[0]:.2f}}-%{{customdata[1]:.2f}}<br>count=%{{y}}<extra></extra>',
+    ))
+    fig.update_layout(
+        xaxis_title=x,
+        yaxis_title='count',
+        bargap=0,
+        **layout
+    )
+    return fig
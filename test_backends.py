@@ -0,0 +1,82 @@
+# <----------Backend Parity Tests---------->
+
+# Every installed backend must load, clean and query the Play Store export
+# exactly like pandas. Run with:
+#
+#   python -m pytest test_backends.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backends import BACKEND_NAMES, PandasBackend, _assert_same, get_backend, parity_queries
+from cleaning import clean_apps, clean_reviews
+
+APPS_PATH = 'Play Store Data.csv'
+
+
+def _backend(name):
+    try:
+        return get_backend(name)
+    except ImportError as exc:
+        pytest.skip(f"{name} is not installed: {exc}")
+
+
+@pytest.fixture(scope='module')
+def apps_df():
+    return clean_apps(PandasBackend().read_apps(APPS_PATH))
+
+
+# The review file is not shipped with the repository: a few reviews per app
+# with a fixed spread of subjectivity scores, so Fig 15 keeps some apps and
+# drops others
+@pytest.fixture(scope='module')
+def reviews_df(apps_df):
+    apps = np.repeat(apps_df['App'].unique(), 3)
+    return clean_reviews(pd.DataFrame({
+        'App': apps,
+        'Translated_Review': 'Review',
+        'Sentiment_Subjectivity': (np.arange(len(apps)) % 7) / 6,
+    }))
+
+
+@pytest.fixture(scope='module')
+def expected(apps_df, reviews_df):
+    reference = PandasBackend()
+    return {name: query(reference) for name, query in parity_queries(apps_df, reviews_df).items()}
+
+
+@pytest.mark.parametrize('backend_name', BACKEND_NAMES[1:])
+def test_clean_apps(backend_name, apps_df):
+    backend = _backend(backend_name)
+    _assert_same(apps_df, clean_apps(backend.read_apps(APPS_PATH)))
+
+
+# The export as edited by hand: the shifted row removed and one 'Reviews'
+# cell left blank, so pandas would infer a float column if it were allowed to
+@pytest.fixture(scope='module')
+def edited_apps_path(tmp_path_factory):
+    raw_df = pd.read_csv(APPS_PATH, dtype=str)
+    raw_df = raw_df[raw_df['Category'] != '1.9']
+    raw_df.loc[raw_df.index[5], 'Reviews'] = None
+    path = tmp_path_factory.mktemp('exports') / 'edited.csv'
+    raw_df.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('backend_name', BACKEND_NAMES)
+def test_clean_edited_export(backend_name, apps_df, edited_apps_path):
+    backend = _backend(backend_name)
+    edited_df = clean_apps(backend.read_apps(edited_apps_path))
+    assert len(edited_df) == len(apps_df)
+    _assert_same(clean_apps(PandasBackend().read_apps(edited_apps_path)), edited_df)
+
+
+@pytest.mark.parametrize('backend_name', BACKEND_NAMES[1:])
+def test_queries(backend_name, apps_df, reviews_df, expected):
+    backend = _backend(backend_name)
+    for name, query in parity_queries(apps_df, reviews_df).items():
+        try:
+            _assert_same(expected[name], query(backend))
+        except AssertionError as exc:
+            raise AssertionError(f"{name}: {exc}") from exc
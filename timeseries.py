@@ -0,0 +1,162 @@
+# <----------Time-Series Pyramid---------->
+
+# Multi-resolution aggregates for the trend figures (Figs 6, 14 and 16). A
+# series is aggregated once per group and day; the week, month and year
+# levels are rolled up from the daily level, so any level and date window
+# is then a slice instead of a new group-by over the apps.
+#
+# Charts ship at most `max_points` points per trace: level() can pick the
+# finest resolution that fits the requested window, and downsample() thins
+# longer line traces with the Largest-Triangle-Three-Buckets algorithm, which
+# keeps the peaks and troughs that give a line its shape. Scatter clouds
+# such as the per-app points of Fig 9 are thinned by sample() instead: LTTB
+# favours the extreme points, which would distort the cloud's distribution.
+
+import numpy as np
+import pandas as pd
+
+
+# Coarsest to finest, with the pandas period of each level
+RESOLUTIONS = {
+    'year': 'Y',
+    'month': 'M',
+    'week': 'W',
+    'day': 'D',
+}
+
+# Points per trace shipped to the browser
+MAX_POINTS = 1000
+
+
+# Length of one period at each resolution
+PERIOD_OFFSETS = {
+    'year': pd.DateOffset(years=1),
+    'month': pd.DateOffset(months=1),
+    'week': pd.DateOffset(weeks=1),
+    'day': pd.DateOffset(days=1),
+}
+
+
+class TimeSeriesPyramid:
+
+    def __init__(self, levels, group, time, values):
+        # Resolution -> frame of (group, period start) sums, sorted, with the
+        # '<value>_Growth_Pct' over the previous period and 'Cumulative_<value>'
+        # running total of each summed value column
+        self.levels = levels
+        self.group = group
+        self.time = time
+        self.values = values
+
+    # Sum the value columns (and count the rows, as 'Count') of df per group
+    # and period of its time column
+    @classmethod
+    def from_frame(cls, df, group, time, values=()):
+        values = list(values) + ['Count']
+        daily = (
+            df[[group, time] + values[:-1]]
+            .dropna(subset=[time])
+            .assign(**{time: df[time].dt.floor('D'), 'Count': 1})
+            .groupby([group, time], sort=True)[values].sum()
+            .reset_index()
+        )
+        levels = {'day': daily}
+        for resolution in ('week', 'month', 'year'):
+            start = daily[time].dt.to_period(RESOLUTIONS[resolution]).dt.start_time
+            levels[resolution] = (
+                daily.assign(**{time: start})
+                .groupby([group, time], sort=True)[values].sum()
+                .reset_index()
+            )
+
+        for df_level in levels.values():
+            grouped = df_level.groupby(group)
+            for value in values:
+                df_level[f"{value}_Growth_Pct"] = grouped[value].pct_change()
+                df_level[f"Cumulative_{value}"] = grouped[value].cumsum()
+        return cls(levels, group, time, values)
+
+    # Finest resolution whose longest trace inside [start, end] has at most
+    # max_points periods
+    def resolution_for(self, start=None, end=None, max_points=MAX_POINTS):
+        for resolution in reversed(RESOLUTIONS):
+            df = self._window(self.levels[resolution], start, end)
+            if df.empty or df.groupby(self.group).size().max() <= max_points:
+                return resolution
+        return 'year'
+
+    # Aggregates at one resolution ('auto': see resolution_for), optionally
+    # limited to a date window
+    def level(self, resolution='month', start=None, end=None, max_points=MAX_POINTS):
+        if resolution == 'auto':
+            resolution = self.resolution_for(start, end, max_points)
+        if resolution not in self.levels:
+            raise ValueError(f"Unknown resolution {resolution!r}, expected one of {', '.join(RESOLUTIONS)} or auto")
+        return self._window(self.levels[resolution], start, end).reset_index(drop=True), resolution
+
+    def _window(self, df, start, end):
+        mask = np.ones(len(df), dtype=bool)
+        if start is not None:
+            mask &= (df[self.time] >= start).to_numpy()
+        if end is not None:
+            mask &= (df[self.time] <= end).to_numpy()
+        return df[mask]
+
+
+# Largest-Triangle-Three-Buckets: indices of at most n_out points of the
+# series (x sorted ascending) that best preserve its visual shape. The first
+# and last points are always kept; every bucket in between contributes the
+# point forming the largest triangle with the previously kept point and the
+# average of the next bucket.
+def lttb(x, y, n_out):
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n) if n <= n_out else np.unique([0, n - 1])
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # n_out - 2 buckets over the points between the first and the last
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+# Thin every trace of a long-format frame to at most max_points rows with
+# LTTB, keeping the rows in their original order; rows with a missing x or y
+# are dropped
+def downsample(df, x, y, group=None, max_points=MAX_POINTS):
+    df = df.dropna(subset=[x, y])
+    x_values = df[x].to_numpy()
+    if np.issubdtype(x_values.dtype, np.datetime64):
+        x_values = x_values.astype('datetime64[ns]').astype(np.int64)
+    y_values = df[y].to_numpy(dtype=float)
+
+    traces = df.groupby(group, sort=False).indices.values() if group else [np.arange(len(df))]
+    keep = []
+    for positions in traces:
+        positions = positions[np.argsort(x_values[positions], kind='stable')]
+        keep.append(positions[lttb(x_values[positions], y_values[positions], max_points)])
+    return df.iloc[np.sort(np.concatenate(keep))] if keep else df
+
+
+# Thin every group of a frame to at most max_points rows with a uniform
+# random sample, keeping the rows in their original order. The sample is
+# seeded, so the same request always ships the same points.
+def sample(df, group=None, max_points=MAX_POINTS, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = df.groupby(group, sort=False).indices.values() if group else [np.arange(len(df))]
+    keep = [
+        positions if len(positions) <= max_points else rng.choice(positions, max_points, replace=False)
+        for positions in groups
+    ]
+    return df.iloc[np.sort(np.concatenate(keep))] if keep else df
@@ -0,0 +1,153 @@
+# <----------Validation and Quarantine---------->
+
+# Checks every column of the Play Store export against its expected pattern,
+# allowed values and range, and parses the numeric and date columns, in one
+# vectorized pass per column over the column's distinct values. Rows failing
+# any check are set aside with the reasons instead of aborting the run; the
+# remaining rows come out with typed columns, so nothing is parsed twice.
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnRule:
+
+    def __init__(self, pattern=None, values=None, parse=None, low=None, high=None, nullable=False):
+        # Full-match regex for the value's text
+        self.pattern = pattern
+        # Allowed values, checked instead of / in addition to the pattern
+        self.values = values
+        # Vectorized parser: Series of matching strings -> typed Series
+        self.parse = parse
+        # Inclusive range of the parsed value
+        self.low = low
+        self.high = high
+        # Whether a missing value is accepted
+        self.nullable = nullable
+
+
+def _parse_rating(values):
+    return values.astype(float)
+
+
+# Count patterns allow at most 18 digits, so every matching value fits in
+# an int64 and longer ones are quarantined instead of overflowing here
+def _parse_count(values):
+    return values.str.replace(r'[+,]', '', regex=True).astype('int64')
+
+
+# Size in MB, 'k' sizes converted from KB and 'Varies with device' as NaN
+def _parse_size(values):
+    number = pd.to_numeric(values.str[:-1], errors='coerce')
+    return pd.Series(np.where(values.str.endswith('k'), number / 1024, number), index=values.index)
+
+
+def _parse_price(values):
+    return values.str.lstrip('$').astype(float)
+
+
+def _parse_date(values):
+    return pd.to_datetime(values, format='%B %d, %Y', errors='coerce')
+
+
+# Columns that Play Store data may leave empty are filled by cleaning
+# (column mode) before validation, so only the missing 'Rating' values remain
+APP_RULES = {
+    'App': ColumnRule(pattern=r'.*\S.*'),
+    'Category': ColumnRule(pattern=r'[A-Z][A-Z_]*'),
+    'Rating': ColumnRule(pattern=r'\d+(?:\.\d+)?', parse=_parse_rating, low=1.0, high=5.0),
+    'Reviews': ColumnRule(pattern=r'\d{1,18}', parse=_parse_count),
+    'Size': ColumnRule(pattern=r'\d+(?:\.\d+)?[Mk]|Varies with device', parse=_parse_size),
+    'Installs': ColumnRule(pattern=r'\d{1,3}(?:,\d{3}){0,5}\+?', parse=_parse_count),
+    'Type': ColumnRule(values=['Free', 'Paid']),
+    'Price': ColumnRule(pattern=r'0|\$\d+(?:\.\d+)?', parse=_parse_price, low=0.0),
+    'Content Rating': ColumnRule(values=['Everyone', 'Everyone 10+', 'Teen', 'Mature 17+', 'Adults only 18+', 'Unrated']),
+    'Genres': ColumnRule(pattern=r'[^;]+(?:;[^;]+)*'),
+    'Last Updated': ColumnRule(parse=_parse_date, low=pd.Timestamp('2008-01-01')),
+    'Current Ver': ColumnRule(pattern=r'.*\S.*'),
+    'Android Ver': ColumnRule(pattern=r'\d+(?:\.\d+)*W?(?: and up| - \d+(?:\.\d+)*)|Varies with device'),
+}
+
+
+# Check one column's distinct values. Returns the row codes, the distinct
+# values as text, the failure message per distinct value (None when valid)
+# and the parsed distinct values.
+def _check_column(series, rule):
+    codes, uniques = pd.factorize(series)
+    text = pd.Series(uniques, dtype=object).astype(str)
+    messages = np.full(len(text), None, dtype=object)
+
+    def fail(mask, message):
+        mask = np.asarray(mask, dtype=bool) & pd.isna(messages)
+        messages[mask] = message
+
+    if rule.pattern is not None:
+        fail(~text.str.fullmatch(rule.pattern).to_numpy(dtype=bool), 'unexpected format')
+    if rule.values is not None:
+        fail(~text.isin(rule.values).to_numpy(), 'unexpected value')
+
+    parsed = None
+    if rule.parse is not None:
+        valid = pd.isna(messages)
+        parsed = rule.parse(text[valid])
+        # With a pattern, a missing parsed value is intended (e.g. 'Varies
+        # with device' sizes); without one, it means the text did not parse
+        if rule.pattern is None:
+            fail(_scatter(parsed.isna().to_numpy(), valid), 'cannot be parsed')
+        if rule.low is not None:
+            fail(_scatter((parsed < rule.low).to_numpy(), valid), f"below {rule.low}")
+        if rule.high is not None:
+            fail(_scatter((parsed > rule.high).to_numpy(), valid), f"above {rule.high}")
+    return codes, text, messages, parsed
+
+
+# Spread a mask over the valid distinct values back to all distinct values
+def _scatter(mask, valid):
+    full = np.zeros(len(valid), dtype=bool)
+    full[valid] = mask
+    return full
+
+
+class ValidationResult:
+
+    def __init__(self, valid_df, quarantine_df):
+        self.valid_df = valid_df
+        # Rejected input rows, unchanged, with their 'Row' position in the
+        # export and the 'Reasons' they were rejected for
+        self.quarantine_df = quarantine_df
+
+
+def validate(df, rules=APP_RULES, raw_df=None):
+    missing_columns = set(rules) - set(df.columns)
+    if missing_columns:
+        raise ValueError(f"Missing column(s): {', '.join(sorted(missing_columns))}")
+
+    checks = {column: _check_column(df[column], rule) for column, rule in rules.items()}
+
+    # Failing rows per column; reason strings are only built for those rows
+    row_failures = {}
+    bad = np.zeros(len(df), dtype=bool)
+    for column, (codes, text, messages, parsed) in checks.items():
+        row_failed = np.append(pd.notna(messages), not rules[column].nullable)[codes]
+        if row_failed.any():
+            row_failures[column] = row_failed
+            bad |= row_failed
+
+    valid_df = df[~bad].copy()
+    for column, (codes, text, messages, parsed) in checks.items():
+        if parsed is not None:
+            # Valid rows only reference distinct values that were parsed
+            valid_df[column] = parsed.reindex(codes[~bad]).to_numpy()
+
+    source = df if raw_df is None else raw_df.loc[df.index]
+    quarantine_df = source[bad].copy()
+    reasons = [[] for _ in range(int(bad.sum()))]
+    for column, row_failed in row_failures.items():
+        codes, text, messages, parsed = checks[column]
+        bad_codes = codes[bad]
+        for i in np.flatnonzero(row_failed[bad]):
+            code = bad_codes[i]
+            reasons[i].append(f"{column}: missing" if code < 0 else f"{column}: {messages[code]} ({text[code]!r})")
+    quarantine_df.insert(0, 'Row', quarantine_df.index)
+    quarantine_df['Reasons'] = ['; '.join(r) for r in reasons]
+    return ValidationResult(valid_df, quarantine_df)
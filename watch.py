@@ -0,0 +1,146 @@
+# <----------Watch Mode---------->
+
+# Keeps the cleaned frames and sentiment scores in memory and rebuilds the
+# dashboard when an input file changes, re-running only the stages that
+# depend on it:
+#
+#   apps file changed     -> re-read and clean apps, rebuild the genre index
+#                            and the figures built from apps; reviews are
+#                            not re-scored
+#   reviews file changed  -> re-read, clean and score reviews, rebuild only
+#                            the figures built from reviews (Fig 4, Fig 15)
+#
+# The dashboard is served locally and the page reloads itself after each
+# rebuild (assets/live_reload.js), so the browser is opened only once.
+#
+#   python Google_Play_Store_Analysis-Dashboard.py --watch
+
+import functools
+import os
+import threading
+import time
+import webbrowser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from cleaning import clean_apps, clean_reviews
+from dashboard import render_figures, write_dashboard
+from figures import FIGURES
+from genres import GenreIndex
+from pipeline import score_sentiment
+
+
+class DashboardWatcher:
+
+    def __init__(self, data, apps_path, reviews_path, html_files_path="./", quarantine_path='quarantine.csv'):
+        self.data = data
+        self.paths = {'apps': apps_path, 'reviews': reviews_path}
+        self.html_files_path = html_files_path
+        self.quarantine_path = quarantine_path
+        self.signatures = {name: _signature(path) for name, path in self.paths.items()}
+        self.plot_containers = {}
+        # Inputs whose last rebuild failed, retried with the next change
+        self.pending = set()
+        # Bumped after every rebuild; polled by the live-reload script
+        self.version = 0
+
+    # Input names whose file changed since the last check
+    def changed_inputs(self):
+        changed = set()
+        for name, path in self.paths.items():
+            signature = _signature(path)
+            if signature != self.signatures[name]:
+                self.signatures[name] = signature
+                changed.add(name)
+        return changed
+
+    def reload(self, changed):
+        data = self.data
+        if 'apps' in changed:
+            data.apps_df = clean_apps(data.backend.read_apps(self.paths['apps']), self.quarantine_path)
+            data.genre_index = GenreIndex.from_series(data.apps_df['Genres'])
+        if 'reviews' in changed:
+            data.reviews_df = score_sentiment(clean_reviews(pd.read_csv(self.paths['reviews'])))
+
+    # Render the figures depending on the changed inputs (default: all) and
+    # rewrite index.html with the cached containers of the others
+    def rebuild(self, changed=None):
+        numbers = None if changed is None else [
+            number for number, spec in FIGURES.items() if spec.inputs & changed
+        ]
+        self.plot_containers.update(render_figures(self.data, self.html_files_path, numbers=numbers))
+        write_dashboard(self.plot_containers, self.html_files_path, live_reload=True)
+        self.version += 1
+        return sorted(self.plot_containers) if numbers is None else numbers
+
+    def poll(self):
+        changed = self.changed_inputs()
+        if not changed:
+            return
+        changed |= self.pending
+        start = time.perf_counter()
+        try:
+            self.reload(changed)
+            numbers = self.rebuild(changed)
+        except Exception as exc:
+            # Keep serving the last good dashboard; the next change retries
+            print(f"Rebuild after change to {', '.join(sorted(changed))} failed: {type(exc).__name__}: {exc}")
+            self.pending = changed
+            return
+        self.pending = set()
+        print(f"Rebuilt figures {', '.join(map(str, numbers))} after change to "
+              f"{', '.join(sorted(changed))} ({time.perf_counter() - start:.1f}s)")
+
+
+# Cheap change detection: modification time and size
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def make_handler(watcher):
+
+    class WatchHandler(SimpleHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/__version':
+                return super().do_GET()
+            body = str(watcher.version).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return functools.partial(WatchHandler, directory=watcher.html_files_path)
+
+
+def watch(data, apps_path, reviews_path, html_files_path="./", host='127.0.0.1', port=8060, interval=1.0,
+          open_browser=True):
+    watcher = DashboardWatcher(data, apps_path, reviews_path, html_files_path)
+    watcher.rebuild()
+
+    server = ThreadingHTTPServer((host, port), make_handler(watcher))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://{host}:{port}/index.html"
+    print(f"Watching {apps_path} and {reviews_path}; dashboard on {url} (Ctrl+C to stop)")
+    if open_browser:
+        webbrowser.open(url)
+
+    try:
+        while True:
+            time.sleep(interval)
+            watcher.poll()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()